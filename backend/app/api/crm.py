@@ -2,6 +2,7 @@
 CRM integration API endpoints
 """
 
+import time
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
@@ -39,6 +40,7 @@ from app.models.crm_config import (
 )
 from app.models.approval import DealMatch
 from app.services.hubspot.types import CRMSchema
+from app.services.hubspot.sync import invalidate_connection_metadata
 from app.services.hubspot.oauth import (
     oauth_enabled,
     build_authorize_url,
@@ -87,7 +89,7 @@ def get_hubspot_client_from_connection(
             detail="HubSpot access token is missing",
         )
     
-    return HubSpotClient(access_token)
+    return HubSpotClient(access_token, rate_limit_key=connection["id"])
 
 
 @router.post("/hubspot/connect", response_model=ConnectHubSpotResponse)
@@ -148,6 +150,9 @@ async def connect_hubspot(
         "metadata": {
             "portal_id": validation_result.portal_id,
             "region": validation_result.region,
+            "scopes_ok": validation_result.scopes_ok,
+            "missing_sync_scope": validation_result.missing_sync_scope,
+            "scopes_checked_at": int(time.time()),
         },
     }
     
@@ -178,6 +183,7 @@ async def connect_hubspot(
         )
     
     connection = result.data[0]
+    invalidate_connection_metadata(connection["id"])
     
     return ConnectHubSpotResponse(
         connection_id=UUID(connection["id"]),
@@ -287,16 +293,21 @@ async def hubspot_callback(
         "metadata": {
             "portal_id": validation_result.portal_id,
             "region": validation_result.region or "na1",
+            "scopes_ok": validation_result.scopes_ok,
+            "missing_sync_scope": validation_result.missing_sync_scope,
+            "scopes_checked_at": int(time.time()),
         },
     }
 
     try:
-        supabase.table("crm_connections").upsert(
+        result = supabase.table("crm_connections").upsert(
             connection_data,
             on_conflict="user_id,provider",
         ).execute()
     except Exception:
         return RedirectResponse(url=f"{error_url}&error=save_failed", status_code=302)
+    for connection in result.data or []:
+        invalidate_connection_metadata(connection["id"])
 
     return RedirectResponse(url=success_url, status_code=302)
 
@@ -672,7 +672,7 @@ async def approve_memo(
                 auto_create_contacts = None
             
             # Initialize HubSpot services
-            client = HubSpotClient(crm_connection["access_token"])
+            client = HubSpotClient(crm_connection["access_token"], rate_limit_key=crm_connection["id"])
             schema_service = HubSpotSchemaService(client, supabase, crm_connection["id"])
             search_service = HubSpotSearchService(client)
             deal_service = HubSpotDealService(client, search_service, schema_service)
@@ -726,6 +726,7 @@ async def approve_memo(
                 auto_create_contact_company=auto_create_contact_company,
                 auto_create_companies=auto_create_companies,
                 auto_create_contacts=auto_create_contacts,
+                connection_metadata=crm_connection.get("metadata") or {},
             )
             
             if not sync_result.success:
@@ -837,7 +838,7 @@ def get_hubspot_client_from_connection(
             )
         
         connection = result.data
-        return HubSpotClient(connection["access_token"]), connection["id"]
+        return HubSpotClient(connection["access_token"], rate_limit_key=connection["id"]), connection["id"]
     except Exception as e:
         error_str = str(e)
         if "no rows" in error_str.lower() or "PGRST116" in error_str:
@@ -896,6 +897,7 @@ async def match_memo_to_deals(
             return []  # No matches if not connected
             
         access_token = conn_result.data["access_token"]
+        connection_id = conn_result.data["id"]
     except Exception as e:
         error_str = str(e)
         if "no rows" in error_str.lower() or "PGRST116" in error_str:
@@ -908,7 +910,7 @@ async def match_memo_to_deals(
     pipeline_id = config.default_pipeline_id if config else None
     
     # Initialize services
-    client = HubSpotClient(access_token)
+    client = HubSpotClient(access_token, rate_limit_key=connection_id)
     search_service = HubSpotSearchService(client)
     matching_service = HubSpotMatchingService(client, search_service)
     
@@ -1001,7 +1003,7 @@ async def get_approval_preview(
     )
     
     # Initialize services
-    client = HubSpotClient(access_token)
+    client = HubSpotClient(access_token, rate_limit_key=connection_id)
     schema_service = HubSpotSchemaService(client, supabase, connection_id)
     search_service = HubSpotSearchService(client)
     deal_service = HubSpotDealService(client, search_service, schema_service)
@@ -1109,7 +1111,7 @@ async def post_approval_preview(
         else ["dealname", "amount", "description", "closedate"]
     )
 
-    client = HubSpotClient(access_token)
+    client = HubSpotClient(access_token, rate_limit_key=connection_id)
     schema_service = HubSpotSchemaService(client, supabase, connection_id)
     search_service = HubSpotSearchService(client)
     deal_service = HubSpotDealService(client, search_service, schema_service)
@@ -1229,7 +1231,7 @@ async def cleanup_orphans(
     
     if company_id:
         try:
-            client = HubSpotClient(access_token)
+            client = HubSpotClient(access_token, rate_limit_key=connection_id)
             await client.delete(f"/crm/v3/objects/companies/{company_id}")
             cleaned.append({"type": "company", "id": company_id})
         except Exception as e:
@@ -1238,7 +1240,7 @@ async def cleanup_orphans(
     
     if contact_id:
         try:
-            client = HubSpotClient(access_token)
+            client = HubSpotClient(access_token, rate_limit_key=connection_id)
             await client.delete(f"/crm/v3/objects/contacts/{contact_id}")
             cleaned.append({"type": "contact", "id": contact_id})
         except Exception as e:
@@ -41,7 +41,7 @@ DOMAIN_UNIPILE = "unipile"
 
 def _merge_extra(**kwargs: Any) -> dict[str, Any]:
     """Merge correlation_id with extra kwargs for structured logging."""
-    extra = dict(kwargs)
+    extra = kwargs  # already a fresh dict per call; no copy needed
     cid = get_correlation_id()
     if cid:
         extra["correlation_id"] = cid
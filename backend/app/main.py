@@ -3,6 +3,7 @@ FastAPI application entry point
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,6 +17,9 @@ from app.api.router import api_router
 from app.logging_config import configure_logging
 import asyncio
 
+# Worker threads for blocking Supabase calls made from async code
+SUPABASE_THREAD_POOL_WORKERS = 32
+
 # Configure logging first for full backend visibility
 configure_logging(
     level=settings.LOG_LEVEL,
@@ -132,9 +136,15 @@ except ImportError:
 async def startup_event():
     """
     Startup event handler.
-    Recovers stuck memo processing tasks on server startup.
+    Sizes the thread pool used for blocking Supabase calls and
+    recovers stuck memo processing tasks on server startup.
     """
     logger = logging.getLogger(__name__)
+    # Blocking Supabase client calls run via asyncio.to_thread; this bounds how many
+    # run at once (and so the PostgREST connections in use)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=SUPABASE_THREAD_POOL_WORKERS, thread_name_prefix="supabase")
+    )
     try:
         from app.deps import get_supabase
         from app.services.recovery import RecoveryService
@@ -160,6 +170,16 @@ async def startup_event():
         )
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish background HubSpot sync work, then close pooled outbound HTTP connections."""
+    from app.services.hubspot.client import close_http_client
+    from app.services.hubspot.sync import drain_background_sync
+
+    await drain_background_sync()
+    await close_http_client()
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -3,6 +3,8 @@ Prometheus metrics for full backend visibility.
 All metric calls are wrapped to never break the main flow.
 """
 
+from functools import lru_cache
+
 from prometheus_client import Counter, Histogram
 
 # Histograms for latency
@@ -55,8 +57,22 @@ def _safe(fn, *args, **kwargs) -> None:
         pass
 
 
+@lru_cache(maxsize=1024)
+def _child(metric, *label_values):
+    """Labelled child of a metric, cached: labels() takes a lock and a lookup per call."""
+    return metric.labels(*label_values)
+
+
+def _inc(metric, *label_values) -> None:
+    _child(metric, *label_values).inc()
+
+
+def _observe(metric, value: float, *label_values) -> None:
+    _child(metric, *label_values).observe(value)
+
+
 def record_transcription_duration(seconds: float, source: str) -> None:
-    _safe(transcription_duration.labels(source=source).observe, seconds)
+    _safe(_observe, transcription_duration, seconds, source)
 
 
 def record_extraction_duration(seconds: float) -> None:
@@ -64,20 +80,20 @@ def record_extraction_duration(seconds: float) -> None:
 
 
 def record_sync_duration(seconds: float, result: str) -> None:
-    _safe(sync_duration.labels(result=result).observe, seconds)
+    _safe(_observe, sync_duration, seconds, result)
 
 
 def inc_pipeline_error(domain: str, phase: str) -> None:
-    _safe(pipeline_errors.labels(domain=domain, phase=phase).inc)
+    _safe(_inc, pipeline_errors, domain, phase)
 
 
 def inc_llm_request(status: str, model: str) -> None:
-    _safe(llm_requests.labels(status=status, model=model).inc)
+    _safe(_inc, llm_requests, status, model)
 
 
 def inc_webhook_message(provider: str, outcome: str) -> None:
-    _safe(webhook_messages.labels(provider=provider, outcome=outcome).inc)
+    _safe(_inc, webhook_messages, provider, outcome)
 
 
 def inc_unipile_api_call(operation: str, status: str) -> None:
-    _safe(unipile_api_calls.labels(operation=operation, status=status).inc)
+    _safe(_inc, unipile_api_calls, operation, status)
@@ -2,9 +2,10 @@
 CRM Updates service for tracking what was pushed to CRM
 """
 
+import asyncio
 from datetime import datetime
 from supabase import Client
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from app.models.crm_update import CRMUpdateCreate, CRMUpdateUpdate
 
 
@@ -14,6 +15,26 @@ class CRMUpdatesService:
     def __init__(self, supabase: Client):
         self.supabase = supabase
     
+    @staticmethod
+    def build_update(
+        memo_id: str,
+        user_id: str,
+        crm_connection_id: str,
+        action_type: str,
+        resource_type: str,
+        data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build a CRM update row (for create_updates)"""
+        return {
+            "memo_id": memo_id,
+            "user_id": user_id,
+            "crm_connection_id": crm_connection_id,
+            "action_type": action_type,
+            "resource_type": resource_type,
+            "data": data,
+            "status": "pending",
+        }
+    
     async def create_update(
         self,
         memo_id: str,
@@ -29,15 +50,9 @@ class CRMUpdatesService:
         Returns:
             The created CRM update ID
         """
-        update_data = {
-            "memo_id": memo_id,
-            "user_id": user_id,
-            "crm_connection_id": crm_connection_id,
-            "action_type": action_type,
-            "resource_type": resource_type,
-            "data": data,
-            "status": "pending",
-        }
+        update_data = self.build_update(
+            memo_id, user_id, crm_connection_id, action_type, resource_type, data
+        )
         
         result = self.supabase.table("crm_updates").insert(update_data).execute()
         
@@ -46,6 +61,29 @@ class CRMUpdatesService:
         
         return result.data[0]["id"]
     
+    async def create_updates(self, updates: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several CRM update records in a single insert
+        
+        Args:
+            updates: Rows built with build_update
+        
+        Returns:
+            The created CRM update IDs
+        """
+        if not updates:
+            return []
+        
+        # Off the event loop: the Supabase client blocks for the whole round-trip
+        result = await asyncio.to_thread(
+            self.supabase.table("crm_updates").insert(updates).execute
+        )
+        
+        if not result.data:
+            raise Exception("Failed to create CRM update records")
+        
+        return [row["id"] for row in result.data]
+    
     async def mark_success(
         self,
         update_id: str,
@@ -93,5 +131,36 @@ class CRMUpdatesService:
         """Get all CRM updates for a memo"""
         result = self.supabase.table("crm_updates").select("*").eq("memo_id", memo_id).order("created_at", desc=False).execute()
         return result.data or []
+    
+    async def get_synced_company_contact_ids(self, memo_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get the company and contact IDs from a memo's latest successful upserts
+        
+        One single-row query per action type (run concurrently), each served by
+        the (memo_id, action_type, created_at) partial index on success rows.
+        
+        Returns:
+            Tuple of (company_id or None, contact_id or None)
+        """
+        company_row, contact_row = await asyncio.gather(
+            asyncio.to_thread(self._latest_successful_data, memo_id, "upsert_company"),
+            asyncio.to_thread(self._latest_successful_data, memo_id, "upsert_contact"),
+        )
+        return company_row.get("company_id"), contact_row.get("contact_id")
+    
+    def _latest_successful_data(self, memo_id: str, action_type: str) -> Dict[str, Any]:
+        """data of the memo's latest successful row for action_type ({} when none)"""
+        result = (
+            self.supabase.table("crm_updates")
+            .select("data")
+            .eq("memo_id", memo_id)
+            .eq("status", "success")
+            .eq("action_type", action_type)
+            .order("created_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+        rows = result.data or []
+        return (rows[0].get("data") or {}) if rows else {}
 
 
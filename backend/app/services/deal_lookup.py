@@ -81,7 +81,9 @@ class DealLookupService:
             config = await self.config_service.get_configuration(user_id)
             pipeline_id = config.default_pipeline_id if config else None
 
-            client = HubSpotClient(conn_result.data[0]["access_token"])
+            client = HubSpotClient(
+                conn_result.data[0]["access_token"], rate_limit_key=conn_result.data[0]["id"]
+            )
             search_service = HubSpotSearchService(client)
             matching_service = HubSpotMatchingService(client, search_service)
 
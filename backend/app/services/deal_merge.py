@@ -16,6 +16,9 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Placeholder deal names (lower-cased) that a memo's deal name may replace
+GENERIC_DEAL_NAMES = frozenset({"new deal", "nuevo deal", "deal", ""})
+
 
 class DealMergeService:
     """
@@ -55,12 +58,11 @@ class DealMergeService:
     ) -> dict[str, Any]:
         """Use new if present, else keep existing. Description = append."""
         merged = {}
-        generic_deal_names = ("new deal", "nuevo deal", "deal", "")
         existing_dealname = (existing.get("dealname") or "").strip().lower()
         for f in allowed_fields:
             if f in ("hs_object_id", "hs_createdate", "hs_lastmodifieddate"):
                 continue
-            if f == "dealname" and existing_dealname in generic_deal_names:
+            if f == "dealname" and existing_dealname in GENERIC_DEAL_NAMES:
                 new_val = new.get("dealname")
                 if new_val:
                     merged[f] = new_val
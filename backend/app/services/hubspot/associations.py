@@ -5,6 +5,9 @@ Handles creating relationships between HubSpot objects
 (contacts, companies, deals).
 """
 
+import asyncio
+from typing import Optional
+
 from .client import HubSpotClient
 from .exceptions import HubSpotError
 
@@ -76,6 +79,84 @@ class HubSpotAssociationService:
                 f"to {to_object_type}:{to_object_id}: {str(e)}"
             )
     
+    async def batch_create_associations(
+        self,
+        from_object_type: str,
+        from_object_id: str,
+        to_object_type: str,
+        to_object_ids: list[str],
+    ) -> None:
+        """
+        Create unlabeled associations from one object to many objects of a type.
+        
+        Uses HubSpot v4 batch default association endpoint (one request):
+        POST /crm/v4/associations/{from}/{to}/batch/associate/default
+        
+        Args:
+            from_object_type: Source object type (e.g., "deals" or "deal")
+            from_object_id: Source object ID
+            to_object_type: Target object type (e.g., "contacts" or "contact")
+            to_object_ids: Target object IDs
+            
+        Raises:
+            HubSpotError for API errors
+        """
+        if not to_object_ids:
+            return
+        try:
+            from_type = self._SINGULAR.get(from_object_type, from_object_type.rstrip("s"))
+            to_type = self._SINGULAR.get(to_object_type, to_object_type.rstrip("s"))
+            await self.client.post(
+                f"/crm/v4/associations/{from_type}/{to_type}/batch/associate/default",
+                data={
+                    "inputs": [
+                        {"from": {"id": str(from_object_id)}, "to": {"id": str(to_id)}}
+                        for to_id in to_object_ids
+                    ]
+                },
+            )
+        except Exception as e:
+            if isinstance(e, HubSpotError):
+                raise
+            raise HubSpotError(
+                f"Failed to create associations from {from_object_type}:{from_object_id} "
+                f"to {to_object_type}:{to_object_ids}: {str(e)}"
+            )
+    
+    async def batch_associate_deal(
+        self,
+        deal_id: str,
+        contact_ids: Optional[list[str]] = None,
+        company_ids: Optional[list[str]] = None,
+    ) -> dict[str, Optional[Exception]]:
+        """
+        Associate a deal to contacts and companies.
+        
+        One batch request per target type; both requests run concurrently.
+        
+        Args:
+            deal_id: HubSpot deal ID
+            contact_ids: Contact IDs to associate
+            company_ids: Company IDs to associate
+            
+        Returns:
+            Mapping of target type ("contacts", "companies") to the error raised,
+            or None when that batch succeeded. Only requested types are included.
+        """
+        targets = [
+            (to_type, ids)
+            for to_type, ids in (("contacts", contact_ids), ("companies", company_ids))
+            if ids
+        ]
+        outcomes = await asyncio.gather(
+            *(self.batch_create_associations("deals", deal_id, to_type, ids) for to_type, ids in targets),
+            return_exceptions=True,
+        )
+        return {
+            to_type: outcome if isinstance(outcome, Exception) else None
+            for (to_type, _), outcome in zip(targets, outcomes)
+        }
+    
     async def associate_contact_to_company(
         self,
         contact_id: str,
@@ -8,9 +8,12 @@ rate limiting, and retries.
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
+from collections import deque
+
 import httpx
 from typing import Any, Optional
-from datetime import datetime, timedelta
 
 from .exceptions import (
     HubSpotError,
@@ -23,6 +26,77 @@ from .exceptions import (
     HubSpotValidationError,
 )
 
+logger = logging.getLogger(__name__)
+
+# Pool limits for the shared client: 100 requests per 10s per portal rarely needs
+# more connections than this, and idle connections are dropped before HubSpot's
+# load balancers close them
+HTTP_POOL_MAX_CONNECTIONS = 100
+HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+# orjson (optional) encodes/decodes request and response bodies several times faster
+# than the stdlib json httpx uses by default
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Connection pool shared by all HubSpotClient instances (auth is a per-request header).
+# Keeps TLS connections alive across requests and syncs instead of a new
+# handshake per call. Bound to the event loop it was created on.
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Recent request times per connection (or access token when no connection ID is
+# known), shared by every HubSpotClient in the process so concurrent syncs on the
+# same portal draw from one rate limit budget. Keying by connection keeps the budget
+# across OAuth token refreshes; idle windows are dropped so the dict stays small.
+_rate_limit_windows: dict[str, deque[float]] = {}
+
+
+def _prune_rate_limit_windows(now: float, window_seconds: float) -> None:
+    """Drop windows whose newest request is outside the window (idle or rotated tokens)."""
+    for key in [k for k, w in _rate_limit_windows.items() if not w or now - w[-1] >= window_seconds]:
+        del _rate_limit_windows[key]
+
+
+def _get_http_client(timeout: float) -> httpx.AsyncClient:
+    """Return the shared pooled AsyncClient, creating it for the running loop if needed."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_MAX_CONNECTIONS,
+                keepalive_expiry=HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        _http_client_loop = loop
+        logger.info(
+            "HubSpot HTTP pool created (http2=%s, max_connections=%d, keepalive_expiry=%.0fs)",
+            HTTP2_ENABLED, HTTP_POOL_MAX_CONNECTIONS, HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HubSpot connection pool (call on application shutdown)."""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
 
 class HubSpotClient:
     """
@@ -34,6 +108,7 @@ class HubSpotClient:
     - Automatic retry for transient failures
     - Rate limit awareness
     - Request/response logging (optional)
+    - Pooled keep-alive connections (HTTP/2 when h2 is installed)
     """
     
     BASE_URL = "https://api.hubapi.com"
@@ -45,18 +120,20 @@ class HubSpotClient:
     RATE_LIMIT_REQUESTS = 100
     RATE_LIMIT_WINDOW = 10  # seconds
     
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, rate_limit_key: Optional[str] = None):
         """
         Initialize HubSpot client.
         
         Args:
             access_token: HubSpot Private App access token or OAuth token
+            rate_limit_key: Key for the shared rate limit window, normally the
+                crm_connections ID; defaults to the access token
         """
         if not access_token or not access_token.strip():
             raise ValueError("Access token cannot be empty")
         
         self.access_token = access_token.strip()
-        self._rate_limit_tracker: list[datetime] = []
+        self.rate_limit_key = str(rate_limit_key) if rate_limit_key else self.access_token
     
     def _get_headers(self) -> dict[str, str]:
         """Get default headers for API requests"""
@@ -65,34 +142,30 @@ class HubSpotClient:
             "Content-Type": "application/json",
         }
     
-    def _check_rate_limit(self) -> None:
+    async def _wait_for_rate_limit(self) -> None:
         """
-        Check if we're approaching rate limit.
+        Wait until a request fits in the rate limit window, then claim the slot.
         
-        HubSpot allows 100 requests per 10 seconds.
-        This is a simple in-memory tracker. For production,
-        consider using Redis or similar for distributed rate limiting.
+        HubSpot allows 100 requests per 10 seconds per app. The sliding window is
+        shared process-wide per rate_limit_key, so concurrent requests queue here
+        instead of bursting into 429s and retry backoff. This is an in-memory limiter;
+        multiple worker processes each get their own budget.
         """
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=self.RATE_LIMIT_WINDOW)
-        
-        # Remove old requests outside the window
-        self._rate_limit_tracker = [
-            ts for ts in self._rate_limit_tracker if ts > window_start
-        ]
-        
-        # Check if we're at the limit
-        if len(self._rate_limit_tracker) >= self.RATE_LIMIT_REQUESTS:
-            # Calculate wait time until oldest request expires
-            oldest = min(self._rate_limit_tracker)
-            wait_seconds = (oldest + timedelta(seconds=self.RATE_LIMIT_WINDOW) - now).total_seconds()
-            raise HubSpotRateLimitError(
-                f"Rate limit exceeded. Wait {wait_seconds:.1f} seconds.",
-                retry_after=int(wait_seconds) + 1,
-            )
-        
-        # Track this request
-        self._rate_limit_tracker.append(now)
+        while True:
+            now = time.monotonic()
+            window = _rate_limit_windows.get(self.rate_limit_key)
+            if window is None:
+                # New key: a good moment to drop windows nobody has used lately
+                _prune_rate_limit_windows(now, self.RATE_LIMIT_WINDOW)
+                window = _rate_limit_windows[self.rate_limit_key] = deque()
+            # Drop requests outside the window
+            while window and now - window[0] >= self.RATE_LIMIT_WINDOW:
+                window.popleft()
+            if len(window) < self.RATE_LIMIT_REQUESTS:
+                window.append(now)
+                return
+            # Sleep until the oldest request leaves the window
+            await asyncio.sleep(self.RATE_LIMIT_WINDOW - (now - window[0]))
     
     def _handle_error_response(
         self,
@@ -197,14 +270,25 @@ class HubSpotClient:
         Raises:
             HubSpotError or subclass for API errors
         """
-        # Check rate limit before making request
-        self._check_rate_limit()
+        # Wait for rate limit budget before making request
+        await self._wait_for_rate_limit()
         
         url = f"{self.BASE_URL}{endpoint}"
         headers = self._get_headers()
         
         try:
-            async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT) as client:
+            client = _get_http_client(self.DEFAULT_TIMEOUT)
+            if orjson is not None and data is not None:
+                # Content-Type is already application/json (see _get_headers)
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    # OPT_NON_STR_KEYS: coerce int/UUID/etc. keys like stdlib json does
+                    content=orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+                    params=params,
+                )
+            else:
                 response = await client.request(
                     method=method,
                     url=url,
@@ -212,25 +296,27 @@ class HubSpotClient:
                     json=data,
                     params=params,
                 )
-                
-                # Handle successful responses
-                if response.status_code == 204:
-                    return None
-                
-                if 200 <= response.status_code < 300:
-                    # Try to parse JSON, fallback to empty dict
-                    try:
-                        return response.json()
-                    except Exception:
-                        return {}
-                
-                # Handle errors
+            
+            # Handle successful responses
+            if response.status_code == 204:
+                return None
+            
+            if 200 <= response.status_code < 300:
+                # Try to parse JSON, fallback to empty dict
                 try:
-                    error_data = response.json()
+                    if orjson is not None:
+                        return orjson.loads(response.content)
+                    return response.json()
                 except Exception:
-                    error_data = {"message": response.text or "Unknown error"}
-                
-                self._handle_error_response(response.status_code, error_data)
+                    return {}
+            
+            # Handle errors
+            try:
+                error_data = response.json()
+            except Exception:
+                error_data = {"message": response.text or "Unknown error"}
+            
+            self._handle_error_response(response.status_code, error_data)
                 
         except HubSpotRateLimitError as e:
             # Retry rate limit errors after waiting
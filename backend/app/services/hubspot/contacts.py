@@ -250,11 +250,11 @@ class HubSpotContactService:
         elif extraction.contactName and str(extraction.contactName).strip():
             # Placeholder: create contact with name so it can be associated with deal
             email = self._placeholder_email(extraction.contactName)
-            extraction = extraction.model_copy(update={"contactEmail": email})
         else:
             return None
         
         properties = self.map_extraction_to_properties(extraction)
+        properties["email"] = email
         
         # Try to find existing contact (Search API or GET-by-email fallback)
         existing = None
@@ -10,7 +10,7 @@ Includes schema-driven enum validation gate (INVALID_OPTION prevention).
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from .client import HubSpotClient
 from .exceptions import HubSpotError
@@ -34,7 +34,7 @@ HUBSPOT_READ_ONLY_DEAL_PROPERTIES = frozenset({
     "hs_analytics_source", "hs_analytics_source_data_1", "hs_analytics_source_data_2",
     "hs_is_closed", "hs_is_closed_won", "hs_date_entered_closedwon", "hs_date_entered_appointmentscheduled",
     "hs_num_associated_contacts", "hs_num_child_companies", "hs_num_child_deals",
-    "hs_merged_object_ids", "hs_analytics_source_data_1", "hs_analytics_source_data_2",
+    "hs_merged_object_ids",
 })
 
 logger = logging.getLogger(__name__)
@@ -358,6 +358,7 @@ class HubSpotDealService:
         self,
         extraction: MemoExtraction,
         deal_name: Optional[str] = None,
+        allowed: Optional[frozenset[str]] = None,
     ) -> dict[str, Any]:
         """
         Convert MemoExtraction to HubSpot properties, including stage resolution.
@@ -367,22 +368,29 @@ class HubSpotDealService:
         Args:
             extraction: MemoExtraction from voice memo
             deal_name: Optional deal name
+            allowed: Only return these properties (skips stage and enum
+                resolution for properties that would be dropped)
             
         Returns:
             Dictionary of HubSpot property names to values
         """
         properties = self.map_extraction_to_properties(extraction, deal_name)
+        if allowed is not None:
+            properties = {k: v for k, v in properties.items() if k in allowed}
         
         # Resolve deal stage: only set when we have a valid HubSpot stage ID
         # (Labels like "Cierre" are resolved via _resolve_stage_id; invalid values are omitted)
         stage_raw = extraction.dealStage or (
             extraction.raw_extraction.get("dealstage") if extraction.raw_extraction else None
         )
-        if stage_raw:
+        if stage_raw and (allowed is None or "dealstage" in allowed):
             stage_id = await self._resolve_stage_id(stage_raw)
             if stage_id:
                 properties["dealstage"] = stage_id
 
+        if not properties:
+            return properties
+
         # Normalize enum fields: LLM returns labels, HubSpot API expects values
         try:
             schema = await self.schema.get_deal_schema()
@@ -399,7 +407,7 @@ class HubSpotDealService:
     async def get(
         self,
         deal_id: str,
-        properties: Optional[list[str]] = None,
+        properties: Optional[Sequence[str]] = None,
     ) -> HubSpotDeal:
         """
         Get a deal by ID.
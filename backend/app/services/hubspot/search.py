@@ -8,6 +8,9 @@ from __future__ import annotations
 
 from typing import Literal, Optional
 
+import httpx
+from pydantic import ValidationError
+
 from .client import HubSpotClient
 from .exceptions import HubSpotError
 from .types import (
@@ -78,8 +81,14 @@ class HubSpotSearchService:
             
             return response["results"]
             
-        except Exception as e:
-            raise HubSpotError(f"Search failed for {object_type}: {str(e)}")
+        except HubSpotError as e:
+            raise HubSpotError(
+                f"Search failed for {object_type}: {str(e)}",
+                status_code=e.status_code,
+                response_data=e.response_data,
+            ) from e
+        except httpx.HTTPError as e:
+            raise HubSpotError(f"Search failed for {object_type}: {str(e)}") from e
     
     async def find_contact_by_email(self, email: Optional[str]) -> HubSpotContact:
         """
@@ -91,14 +100,15 @@ class HubSpotSearchService:
         Returns:
             HubSpotContact if found, None otherwise
         """
-        if not email or not email.strip():
+        email = (email or "").strip().lower()
+        if not email:
             return None
         
         filters = [
             Filter(
                 propertyName="email",
                 operator="EQ",
-                value=email.strip().lower(),
+                value=email,
             )
         ]
         
@@ -114,16 +124,16 @@ class HubSpotSearchService:
         
         try:
             return HubSpotContact(**results[0])
-        except Exception:
+        except ValidationError:
             return None
 
     async def find_contact_by_name(self, name: Optional[str]) -> Optional[HubSpotContact]:
         """
         Find contact by name (firstname or lastname contains the search term).
         """
-        if not name or not name.strip():
+        search_term = (name or "").strip()
+        if not search_term:
             return None
-        search_term = name.strip()
         filters = [
             Filter(
                 propertyName="firstname",
@@ -140,7 +150,7 @@ class HubSpotSearchService:
         if results:
             try:
                 return HubSpotContact(**results[0])
-            except Exception:
+            except ValidationError:
                 pass
         filters = [
             Filter(
@@ -159,7 +169,7 @@ class HubSpotSearchService:
             return None
         try:
             return HubSpotContact(**results[0])
-        except Exception:
+        except ValidationError:
             return None
 
     async def find_company_by_name(self, name: Optional[str]) -> Optional[HubSpotCompany]:
@@ -172,14 +182,15 @@ class HubSpotSearchService:
         Returns:
             HubSpotCompany if found, None otherwise
         """
-        if not name or not name.strip():
+        name = (name or "").strip()
+        if not name:
             return None
         
         filters = [
             Filter(
                 propertyName="name",
                 operator="CONTAINS_TOKEN",
-                value=name.strip(),
+                value=name,
             )
         ]
         
@@ -195,7 +206,7 @@ class HubSpotSearchService:
         
         try:
             return HubSpotCompany(**results[0])
-        except Exception:
+        except ValidationError:
             return None
     
     async def find_company_by_domain(self, domain: Optional[str]) -> Optional[HubSpotCompany]:
@@ -208,11 +219,11 @@ class HubSpotSearchService:
         Returns:
             HubSpotCompany if found, None otherwise
         """
-        if not domain or not domain.strip():
+        domain = (domain or "").strip().lower()
+        if not domain:
             return None
         
         # Normalize domain (remove protocol, www, trailing slash)
-        domain = domain.strip().lower()
         domain = domain.replace("https://", "").replace("http://", "")
         domain = domain.replace("www.", "")
         domain = domain.split("/")[0]
@@ -237,7 +248,7 @@ class HubSpotSearchService:
         
         try:
             return HubSpotCompany(**results[0])
-        except Exception:
+        except ValidationError:
             return None
     
     async def find_deal_by_name(
@@ -255,6 +266,7 @@ class HubSpotSearchService:
         Returns:
             HubSpotDeal if found, None otherwise
         """
+        deal_name = (deal_name or "").strip()
         if not deal_name:
             return None
             
@@ -262,7 +274,7 @@ class HubSpotSearchService:
             Filter(
                 propertyName="dealname",
                 operator="EQ",
-                value=deal_name.strip(),
+                value=deal_name,
             )
         ]
         
@@ -282,7 +294,7 @@ class HubSpotSearchService:
         
         try:
             return HubSpotDeal(**results[0])
-        except Exception:
+        except ValidationError:
             return None
 
     async def search_deals_by_query(
@@ -294,14 +306,15 @@ class HubSpotSearchService:
         """
         Search for deals using a text query (matches name).
         """
-        if not query or not query.strip():
+        query = (query or "").strip()
+        if not query:
             return []
             
         filters = [
             Filter(
                 propertyName="dealname",
                 operator="CONTAINS_TOKEN",
-                value=query.strip(),
+                value=query,
             )
         ]
         
@@ -8,8 +8,10 @@ and associations.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Union
 from uuid import UUID
@@ -18,7 +20,7 @@ from app.logging_config import log_domain, with_timing, DOMAIN_HUBSPOT
 from app.metrics import record_sync_duration, inc_pipeline_error
 
 from .client import HubSpotClient
-from .exceptions import HubSpotAuthError, HubSpotScopeError, HubSpotError
+from .exceptions import HubSpotAuthError, HubSpotScopeError, HubSpotError, HubSpotValidationError
 from .types import SyncResult
 from .contacts import HubSpotContactService
 from .companies import HubSpotCompanyService
@@ -27,86 +29,387 @@ from .deals import HubSpotDealService, HUBSPOT_READ_ONLY_DEAL_PROPERTIES
 # When updating an existing deal (e.g. from extension on a known HubSpot deal page),
 # never overwrite these fields - they belong to the deal context, not the memo.
 FIELDS_PRESERVED_WHEN_UPDATING_EXISTING_DEAL = frozenset({"dealname"})
+# Deal properties always fetched in update mode (merge and result need them)
+DEAL_PROPERTIES_FETCHED_FOR_MERGE = frozenset({"dealname", "amount", "closedate", "description", "dealstage"})
 from .associations import HubSpotAssociationService
 from .tasks import HubSpotTasksService, _parse_date_from_text
+from .validation import HubSpotValidationService
 from app.models.memo import MemoExtraction
 from app.services.crm_updates import CRMUpdatesService
 from app.services.task_merge import TaskMergeService
-from app.services.deal_merge import DealMergeService
+from app.services.deal_merge import DealMergeService, GENERIC_DEAL_NAMES
 
 logger = logging.getLogger(__name__)
 
 
+# Process-local cache of crm_connections.metadata (portal_id, region, hubspot_owner_id).
+# Lets consecutive syncs on the same connection skip the Supabase metadata reads.
+CONNECTION_METADATA_CACHE_TTL_SECONDS = 300
+_connection_metadata_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Resolved HubSpot owner IDs by (connection_id, user_id), stored with the time they
+# were resolved. Hits skip even the metadata cache; entries expire so owner changes
+# in HubSpot are picked up, and the oldest are dropped past OWNER_ID_CACHE_MAX_SIZE.
+OWNER_ID_CACHE_TTL_SECONDS = 600
+OWNER_ID_CACHE_MAX_SIZE = 4096
+_owner_id_cache: dict[tuple[str, str], tuple[float, str]] = {}
+# In-flight lookups, so concurrent syncs for the same user share one owners request
+_owner_lookups_in_flight: dict[tuple[str, str], asyncio.Future] = {}
+
+# Failed owner lookups are remembered in metadata["hubspot_owner_lookup"] so later syncs
+# skip the owners API. "not_found" and "forbidden" (missing crm.objects.owners.read)
+# are retried after this long, so a newly granted scope or owner is picked up.
+OWNER_LOOKUP_RETRY_SECONDS = 24 * 60 * 60
+
+# metadata["missing_sync_scope"] is recorded when the connection is validated. While it
+# is set, syncs fail fast with a scope error naming it; it is re-probed at most this often.
+SCOPE_RECHECK_SECONDS = 15 * 60
+
+
+def invalidate_connection_metadata(connection_id: Optional[Union[UUID, str]] = None) -> None:
+    """
+    Drop cached connection metadata and resolved owner IDs.
+    
+    Args:
+        connection_id: Connection to invalidate, or None for all
+    """
+    if connection_id is None:
+        _connection_metadata_cache.clear()
+        _owner_id_cache.clear()
+    else:
+        connection_id = str(connection_id)
+        _connection_metadata_cache.pop(connection_id, None)
+        for key in [key for key in _owner_id_cache if key[0] == connection_id]:
+            del _owner_id_cache[key]
+
+
+def _get_connection_metadata(supabase, connection_id: str) -> dict[str, Any]:
+    """Read crm_connections.metadata, served from the in-process cache while fresh."""
+    cached = _connection_metadata_cache.get(connection_id)
+    if cached and time.monotonic() - cached[0] < CONNECTION_METADATA_CACHE_TTL_SECONDS:
+        return cached[1]
+    return _read_connection_metadata(supabase, connection_id)
+
+
+def _read_connection_metadata(supabase, connection_id: str) -> dict[str, Any]:
+    """Read crm_connections.metadata from Supabase (bypassing the cache) and cache it."""
+    conn_result = supabase.table("crm_connections").select("metadata").eq(
+        "id", connection_id
+    ).single().execute()
+    conn_data = conn_result.data if conn_result else None
+    metadata = (conn_data or {}).get("metadata") or {}
+    _connection_metadata_cache[connection_id] = (time.monotonic(), metadata)
+    return metadata
+
+
+# In-flight metadata reads, so concurrent cache misses share one Supabase query
+_metadata_reads_in_flight: dict[str, asyncio.Future] = {}
+
+
+async def _load_connection_metadata(supabase, connection_id: str) -> dict[str, Any]:
+    """
+    Async _get_connection_metadata: cache hits return directly, misses read
+    Supabase in a worker thread so the event loop isn't blocked.
+    """
+    cached = _connection_metadata_cache.get(connection_id)
+    if cached and time.monotonic() - cached[0] < CONNECTION_METADATA_CACHE_TTL_SECONDS:
+        return cached[1]
+    read = _metadata_reads_in_flight.get(connection_id)
+    if read is None:
+        read = asyncio.ensure_future(asyncio.to_thread(_get_connection_metadata, supabase, connection_id))
+        _metadata_reads_in_flight[connection_id] = read
+        read.add_done_callback(lambda _: _metadata_reads_in_flight.pop(connection_id, None))
+    return await asyncio.shield(read)
+
+
+# Cleared when the merge_crm_connection_metadata function (migration 008) isn't deployed
+_metadata_merge_rpc_available = True
+
+# PostgREST "function not found in schema cache" / Postgres undefined_function
+_MISSING_FUNCTION_ERROR_CODES = frozenset({"PGRST202", "42883"})
+
+
+def _is_missing_function_error(e: Exception) -> bool:
+    """True when an RPC failed because the database function doesn't exist."""
+    code = getattr(e, "code", None)
+    if code in _MISSING_FUNCTION_ERROR_CODES:
+        return True
+    err_str = str(e)
+    return any(c in err_str for c in _MISSING_FUNCTION_ERROR_CODES)
+
+
+def _merge_connection_metadata(supabase, connection_id: str, updates: dict[str, Any]) -> None:
+    """
+    Merge keys into crm_connections.metadata and refresh the cache.
+    
+    Uses the merge_crm_connection_metadata function (metadata || patch in one
+    statement, so concurrent merges don't clobber each other); falls back to
+    read-modify-write on freshly read metadata only where the function isn't
+    deployed. Other RPC errors (network, timeouts, 5xx) are raised to the caller.
+    """
+    global _metadata_merge_rpc_available
+    if _metadata_merge_rpc_available:
+        try:
+            result = supabase.rpc(
+                "merge_crm_connection_metadata",
+                {"conn_id": connection_id, "patch": updates},
+            ).execute()
+            metadata = result.data if isinstance(result.data, dict) else None
+            if metadata is None:
+                cached = _connection_metadata_cache.get(connection_id)
+                metadata = {**(cached[1] if cached else {}), **updates}
+            _connection_metadata_cache[connection_id] = (time.monotonic(), metadata)
+            return
+        except Exception as e:
+            if not _is_missing_function_error(e):
+                raise
+            _metadata_merge_rpc_available = False
+            logger.warning("Metadata merge function unavailable, using read-modify-write: %s", e)
+    # Fresh read: the cache may be stale or seeded from a caller's copy
+    metadata = {**_read_connection_metadata(supabase, connection_id), **updates}
+    supabase.table("crm_connections").update({
+        "metadata": metadata
+    }).eq("id", connection_id).execute()
+    _connection_metadata_cache[connection_id] = (time.monotonic(), metadata)
+
+
+def _update_connection_metadata(
+    supabase,
+    connection_id: str,
+    updates: dict[str, Any],
+    pending: Optional[dict[str, Any]] = None,
+) -> None:
+    """Merge keys into the metadata now, or collect them in pending for one write later."""
+    if pending is not None:
+        pending.update(updates)
+    else:
+        _merge_connection_metadata(supabase, connection_id, updates)
+
+
+# Note → deal association (HubSpot-defined type 214); shared, read-only
+NOTE_TO_DEAL_ASSOCIATION_TYPES = (
+    {"associationCategory": "HUBSPOT_DEFINED", "associationTypeId": 214},
+)
+
+# HubSpot's hs_note_body limit, counted here in UTF-8 bytes so multi-byte
+# transcripts can't overshoot it
+NOTE_BODY_MAX_BYTES = 65536
+
+
+def _prepare_note_body(transcript: str) -> str:
+    """Strip the transcript and truncate it to NOTE_BODY_MAX_BYTES (UTF-8)."""
+    # Bound the slice before stripping so huge transcripts aren't copied whole
+    note_body = transcript[:NOTE_BODY_MAX_BYTES + 64].strip()
+    # At most 4 bytes per character: short bodies can't exceed the limit
+    if len(note_body) * 4 <= NOTE_BODY_MAX_BYTES:
+        return note_body
+    encoded = note_body.encode("utf-8")
+    if len(encoded) <= NOTE_BODY_MAX_BYTES:
+        return note_body
+    # errors="ignore" drops a multi-byte character split by the cut
+    return encoded[:NOTE_BODY_MAX_BYTES - 3].decode("utf-8", errors="ignore") + "..."
+
+
+# Strong references to background sync work (asyncio only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
+# How long shutdown waits for background sync work (steps 5-7, crm_updates flush)
+BACKGROUND_DRAIN_TIMEOUT_SECONDS = 25.0
+
+
+async def drain_background_sync(timeout: float = BACKGROUND_DRAIN_TIMEOUT_SECONDS) -> None:
+    """
+    Wait for background sync work from every HubSpotSyncService in this process.
+    
+    Called at shutdown before the HTTP pool is closed, so in-flight associations,
+    tasks, notes and their crm_updates rows aren't cut off. Work still running
+    after timeout seconds is left as is and logged.
+    """
+    deadline = time.monotonic() + timeout
+    # Loop: finishing work may spawn more (e.g. a sync completing during shutdown)
+    while _background_tasks:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(
+                "⚠️ Background sync work still running at shutdown",
+                extra=log_domain(DOMAIN_HUBSPOT, "drain_timeout", pending=len(_background_tasks)),
+            )
+            return
+        await asyncio.wait(set(_background_tasks), timeout=remaining)
+
+
+@lru_cache(maxsize=256)
+def _deal_url_prefix(portal_id: str, region: str) -> str:
+    """HubSpot deal record URL up to the deal ID (app-{region} outside na1)."""
+    region_prefix = f"-{region}" if region != "na1" else ""
+    return f"https://app{region_prefix}.hubspot.com/contacts/{portal_id}/record/0-3/"
+
+
+def _cache_owner_id(cache_key: tuple[str, str], owner_id: str) -> None:
+    """Remember a resolved owner ID, evicting the oldest entry when the cache is full."""
+    _owner_id_cache.pop(cache_key, None)
+    if len(_owner_id_cache) >= OWNER_ID_CACHE_MAX_SIZE:
+        # dicts keep insertion order: the first key is the oldest entry
+        del _owner_id_cache[next(iter(_owner_id_cache))]
+    _owner_id_cache[cache_key] = (time.monotonic(), owner_id)
+
+
+async def _completed(value: Any) -> Any:
+    """Awaitable placeholder for a skipped step in asyncio.gather."""
+    return value
+
+
+def _first_value(value: Any, raw: dict[str, Any], *keys: str) -> Any:
+    """value if set, else the first truthy raw[key] (None when there is none)."""
+    if value:
+        return value
+    for key in keys:
+        if raw.get(key):
+            return raw[key]
+    return None
+
+
+def _normalized_email(user: Any) -> str:
+    """Lower-cased email of a Supabase auth user (object or dict), or ""."""
+    try:
+        email = user.email
+    except AttributeError:
+        email = user.get("email") if isinstance(user, dict) else None
+    return str(email or "").strip().lower()
+
+
+def _match_owner_id(owners: list[dict[str, Any]], email_lower: str) -> Optional[str]:
+    """Return the ID of the first owner whose email matches, or None."""
+    for owner in owners:
+        owner_email = (owner.get("email") or "").strip().lower()
+        if owner_email == email_lower:
+            return str(owner.get("id", "")) or None
+    return None
+
+
+async def _find_hubspot_owner_id(client: HubSpotClient, email_lower: str) -> Optional[str]:
+    """
+    Find a HubSpot owner ID by email.
+    Uses the owners endpoint's email filter (one request); pages through all
+    owners only if the portal rejects the filter.
+    """
+    try:
+        resp = await client.get("/crm/v3/owners", params={"email": email_lower, "limit": 1})
+        return _match_owner_id((resp or {}).get("results") or [], email_lower)
+    except HubSpotValidationError:
+        logger.debug("Owners email filter rejected, falling back to full owner scan")
+
+    after = None
+    while True:
+        params = {"limit": 100}
+        if after:
+            params["after"] = after
+        resp = await client.get("/crm/v3/owners", params=params)
+        if not resp or "results" not in resp:
+            return None
+        owner_id = _match_owner_id(resp.get("results", []), email_lower)
+        if owner_id:
+            return owner_id
+        paging = resp.get("paging", {}) or {}
+        after = (paging.get("next") or {}).get("after")
+        if not after:
+            return None
+
+
 async def _get_hubspot_owner_id_for_user(
     client: HubSpotClient,
     supabase,
     user_id: str,
     connection_id: Union[UUID, str],
+    pending_metadata: Optional[dict[str, Any]] = None,
 ) -> Optional[str]:
     """
     Resolve HubSpot owner ID from SaaS user.
     Matches user email (from auth) to HubSpot owner email.
-    Caches result in crm_connections.metadata.
+    Caches the result, including failed lookups, in crm_connections.metadata
+    (collected in pending_metadata when given).
     """
     if not supabase:
         return None
+    connection_id = str(connection_id)
+    cache_key = (connection_id, user_id)
+    cached = _owner_id_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < OWNER_ID_CACHE_TTL_SECONDS:
+        return cached[1]
+    lookup = _owner_lookups_in_flight.get(cache_key)
+    if lookup is None:
+        lookup = asyncio.ensure_future(_lookup_hubspot_owner_id(client, supabase, user_id, connection_id))
+        _owner_lookups_in_flight[cache_key] = lookup
+        lookup.add_done_callback(lambda _: _owner_lookups_in_flight.pop(cache_key, None))
+    # Shielded: one caller being cancelled must not cancel the shared lookup
+    owner_id, metadata_patch = await asyncio.shield(lookup)
+    # Every caller merges the lookup's metadata into its own write: the sync that
+    # started a shared lookup may have returned (and flushed) before it finished
+    if metadata_patch:
+        if pending_metadata is not None:
+            pending_metadata.update(metadata_patch)
+        else:
+            try:
+                await asyncio.to_thread(_merge_connection_metadata, supabase, connection_id, metadata_patch)
+            except Exception as e:
+                logger.warning("Failed to store owner lookup for connection %s: %s", connection_id, e)
+    return owner_id
+
+
+async def _lookup_hubspot_owner_id(
+    client: HubSpotClient,
+    supabase,
+    user_id: str,
+    connection_id: str,
+) -> tuple[Optional[str], dict[str, Any]]:
+    """
+    Owner lookup behind _get_hubspot_owner_id_for_user's in-process caches.
+    
+    Returns:
+        Tuple of (owner ID or None, metadata keys to merge into the connection)
+    """
+    cache_key = (connection_id, user_id)
     try:
         # Check cache in connection metadata
-        conn_result = supabase.table("crm_connections").select("metadata").eq(
-            "id", str(connection_id)
-        ).single().execute()
-        conn_data = conn_result.data if conn_result else None
-        if conn_data:
-            meta = conn_data.get("metadata") or {}
-            cached = meta.get("hubspot_owner_id")
-            if cached:
-                return str(cached)
+        metadata = await _load_connection_metadata(supabase, connection_id)
+        cached = metadata.get("hubspot_owner_id")
+        if cached:
+            _cache_owner_id(cache_key, str(cached))
+            return str(cached), {}
+        lookup = metadata.get("hubspot_owner_lookup") or {}
+        if (
+            lookup.get("status") in ("not_found", "forbidden")
+            and time.time() - (lookup.get("checked_at") or 0) < OWNER_LOOKUP_RETRY_SECONDS
+        ):
+            return None, {}
 
         # Get user email from Supabase auth (admin API)
-        auth_user = supabase.auth.admin.get_user_by_id(user_id)
-        if not auth_user or not getattr(auth_user, "user", None):
-            return None
-        user = auth_user.user if hasattr(auth_user, "user") else auth_user
-        email = (getattr(user, "email", None) or (user.get("email") if isinstance(user, dict) else None)) or ""
-        if not email or not str(email).strip():
-            return None
+        auth_user = await asyncio.to_thread(supabase.auth.admin.get_user_by_id, user_id)
+        user = getattr(auth_user, "user", None) if auth_user else None
+        if not user:
+            return None, {}
+        email_lower = _normalized_email(user)
+        if not email_lower:
+            return None, {}
 
-        # Fetch HubSpot owners (paginate to find match; requires crm.objects.owners.read)
-        email_lower = str(email).strip().lower()
-        after = None
-        while True:
-            params = {"limit": 100}
-            if after:
-                params["after"] = after
-            resp = await client.get("/crm/v3/owners", params=params)
-            if not resp or "results" not in resp:
-                break
-            for owner in resp.get("results", []):
-                owner_email = (owner.get("email") or "").strip().lower()
-                if owner_email == email_lower:
-                    owner_id = str(owner.get("id", ""))
-                    if owner_id:
-                        meta = (conn_data or {}).get("metadata", {}) or {}
-                        supabase.table("crm_connections").update({
-                            "metadata": {**meta, "hubspot_owner_id": owner_id}
-                        }).eq("id", str(connection_id)).execute()
-                        return owner_id
-                    break
-            paging = resp.get("paging", {}) or {}
-            after = (paging.get("next") or {}).get("after")
-            if not after:
-                break
-    except Exception as e:
-        err_str = str(e).lower()
-        if "403" in err_str or "forbidden" in err_str or "scope" in err_str:
+        # Look up the HubSpot owner by email (requires crm.objects.owners.read)
+        try:
+            owner_id = await _find_hubspot_owner_id(client, email_lower)
+        except HubSpotScopeError as e:
+            # Only a 403 from the owners API itself means the scope is missing
             logger.warning(
-                "HubSpot owners API failed (likely missing crm.objects.owners.read scope): %s. "
+                "HubSpot owners API failed (missing crm.objects.owners.read scope): %s. "
                 "Add this scope to your HubSpot Private App to set deal owner.",
                 e,
             )
-        else:
-            logger.warning("Could not resolve HubSpot owner for user %s: %s", user_id, e)
-    return None
+            return None, {"hubspot_owner_lookup": {"status": "forbidden", "checked_at": int(time.time())}}
+        if owner_id:
+            _cache_owner_id(cache_key, owner_id)
+            return owner_id, {"hubspot_owner_id": owner_id, "hubspot_owner_lookup": None}
+        return None, {"hubspot_owner_lookup": {"status": "not_found", "checked_at": int(time.time())}}
+    except Exception as e:
+        logger.warning("Could not resolve HubSpot owner for user %s: %s", user_id, e)
+    return None, {}
 
 
 class HubSpotSyncService:
@@ -118,11 +421,20 @@ class HubSpotSyncService:
     2. Find or create contact (if contactEmail/contactName exists)
     3. Associate contact → company (if both exist)
     4. Create deal (always)
-    5. Associate deal → contact, deal → company
-    6. Track each step in crm_updates table
+    5. Associate deal → contact, deal → company (update mode; created deals
+       carry the associations in the create request)
+    6. Create or merge tasks from next steps
+    7. Add transcript note to the deal
+    8. Track each step in crm_updates table
+    
+    Owner resolution starts once the scope check passes and overlaps the retry
+    lookup and steps 1-4; steps 1-2 run concurrently. Step 3 and steps 5-7
+    (associations, tasks, transcript note) don't affect the result and run in
+    the background, steps 5-7 concurrently with each other; use drain() to
+    wait for them.
     
     Error handling:
-    - Each step is tracked independently
+    - Each step is tracked independently (crm_updates rows written in one batch)
     - Partial failures are logged but don't stop the flow
     - Returns SyncResult with success status and created IDs
     """
@@ -146,25 +458,32 @@ class HubSpotSyncService:
         self.tasks = tasks
         self.crm_updates = crm_updates
         self.supabase = supabase
+        self._background: set[asyncio.Task] = set()
     
     def _filter_properties(
         self,
         properties: dict[str, Any],
-        allowed_fields: list[str],
+        allowed_fields: frozenset[str],
+        existing_properties: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """
         Filter properties to only include allowed fields.
         
         Args:
             properties: Dictionary of HubSpot properties
-            allowed_fields: List of allowed field names
+            allowed_fields: Set of allowed field names
+            existing_properties: When given, also drop values equal to these
             
         Returns:
             Filtered properties dictionary
         """
+        # One set difference up front, then a single hashed lookup per property
+        writable = allowed_fields - HUBSPOT_READ_ONLY_DEAL_PROPERTIES
+        if existing_properties is None:
+            return {k: v for k, v in properties.items() if k in writable}
         return {
             k: v for k, v in properties.items()
-            if k in allowed_fields and k not in HUBSPOT_READ_ONLY_DEAL_PROPERTIES
+            if k in writable and str(existing_properties.get(k) or "") != str(v)
         }
     
     async def sync_memo(
@@ -180,6 +499,7 @@ class HubSpotSyncService:
         auto_create_contact_company: bool = False,
         auto_create_companies: Optional[bool] = None,
         auto_create_contacts: Optional[bool] = None,
+        connection_metadata: Optional[dict[str, Any]] = None,
     ) -> SyncResult:
         """
         Sync a voice memo extraction to HubSpot CRM.
@@ -204,296 +524,215 @@ class HubSpotSyncService:
             auto_create_contact_company: Legacy flag; used for both when auto_create_* not provided
             auto_create_companies: If True, create/upsert company (from crm_configurations)
             auto_create_contacts: If True, create/upsert contact (from crm_configurations)
+            connection_metadata: crm_connections.metadata when the caller already loaded
+                the row; used instead of reading it from Supabase again
         Returns:
             SyncResult with success status and created/updated object IDs
         """
+        # UUIDs from callers: convert once for the payloads, logs and helpers below
+        memo_id = str(memo_id)
+        connection_id = str(connection_id)
+        if connection_metadata is not None:
+            _connection_metadata_cache[connection_id] = (time.monotonic(), connection_metadata)
         create_companies = auto_create_companies if auto_create_companies is not None else auto_create_contact_company
         create_contacts = auto_create_contacts if auto_create_contacts is not None else auto_create_contact_company
         # When updating existing deal, never create company/contact — deal already has them
         if deal_id and not is_new_deal:
             create_companies = False
             create_contacts = False
-        result = SyncResult(memo_id=str(memo_id))
+        result = SyncResult(memo_id=memo_id)
         t0 = time.perf_counter()
         logger.info(
             "🔗 HubSpot sync started",
-            extra=log_domain(DOMAIN_HUBSPOT, "sync_started", memo_id=str(memo_id), user_id=user_id, deal_id=deal_id, is_new_deal=is_new_deal),
-        )
-
-        # Resolve HubSpot owner from user profile (match by email)
-        hubspot_owner_id = await _get_hubspot_owner_id_for_user(
-            self.client, self.supabase, user_id, connection_id
+            extra=log_domain(DOMAIN_HUBSPOT, "sync_started", memo_id=memo_id, user_id=user_id, deal_id=deal_id, is_new_deal=is_new_deal),
         )
-        if hubspot_owner_id:
-            logger.info(
-                "✅ Resolved HubSpot owner",
-                extra=log_domain(DOMAIN_HUBSPOT, "owner_resolved", hubspot_owner_id=hubspot_owner_id, user_id=user_id),
-            )
-        else:
-            logger.info(
-                "⚠️ No HubSpot owner matched",
-                extra=log_domain(DOMAIN_HUBSPOT, "owner_not_matched", user_id=user_id),
-            )
 
         # Default allowed fields if not provided
         if allowed_fields is None:
             allowed_fields = ["dealname", "amount", "description", "closedate"]
+        allowed_set = frozenset(allowed_fields)
         
-        # Check for existing company/contact IDs from previous failed attempts
-        # This prevents creating duplicates on retry
         existing_company_id = None
         existing_contact_id = None
-        
-        if self.supabase:
-            try:
-                # Get previous CRM updates for this memo
-                previous_updates = await self.crm_updates.get_memo_updates(str(memo_id))
-                
-                # Find successful company/contact creations
-                for update in previous_updates:
-                    if update.get("status") == "success":
-                        data = update.get("data", {})
-                        if update.get("action_type") == "upsert_company" and "company_id" in data:
-                            existing_company_id = data["company_id"]
-                        elif update.get("action_type") == "upsert_contact" and "contact_id" in data:
-                            existing_contact_id = data["contact_id"]
-            except Exception:
-                # If we can't check, proceed normally (not critical)
-                pass
-        
-        company_id = existing_company_id
-        contact_id = existing_contact_id
+        owner_task: Optional[asyncio.Task] = None
+        portal_task: Optional[asyncio.Task] = None
+        deal_prefetch: Optional[asyncio.Future] = None
+        deal_created = False
+        # crm_updates rows for Steps 1-4, written in one insert before the background
+        # steps start (or at the end when the sync stops early)
+        pending_updates: list[dict[str, Any]] = []
+        existing_tasks: Optional[list[dict]] = None
+        # Metadata backfills (owner, portal) are written once at the end
+        pending_metadata: dict[str, Any] = {}
         
         try:
-            # Step 1: Company (only when crm_config allows and we have company name)
-            if create_companies and extraction.companyName:
+            # Fail fast on connections already known to lack required scopes
+            await self._verify_scopes(connection_id, pending_metadata)
+
+            # Owner resolution runs alongside the lookups below and Steps 1-4; it's
+            # awaited where the deal is written, otherwise only by the background
+            # steps. It may outlive this call, so it writes its own metadata
+            owner_task = asyncio.create_task(_get_hubspot_owner_id_for_user(
+                self.client, self.supabase, user_id, connection_id
+            ))
+
+            if deal_id and not is_new_deal:
+                # UPDATE MODE: deal properties the memo may change. When the extraction maps
+                # to none of them there's nothing to update: skip the stage lookup and merge,
+                # and fetch only the deal name
+                updatable_fields = (
+                    allowed_set
+                    - FIELDS_PRESERVED_WHEN_UPDATING_EXISTING_DEAL
+                    - HUBSPOT_READ_ONLY_DEAL_PROPERTIES
+                )
+                stage_raw = extraction.dealStage or (extraction.raw_extraction or {}).get("dealstage")
+                has_deal_updates = bool(
+                    updatable_fields.intersection(self.deals.map_extraction_to_properties(extraction))
+                    or (stage_raw and "dealstage" in updatable_fields)
+                )
+                fetch_props = (
+                    tuple(allowed_set | DEAL_PROPERTIES_FETCHED_FOR_MERGE) if has_deal_updates
+                    else ("dealname",)
+                )
+                # The deal (and its tasks, for Step 6) doesn't depend on anything
+                # below; fetch it while the retry lookup runs
+                deal_prefetch = asyncio.gather(
+                    self.deals.get(deal_id, properties=fetch_props),
+                    self._prefetch_deal_tasks(deal_id, memo_id) if extraction.nextSteps else _completed(None),
+                )
+
+            # Check for existing company/contact IDs from previous failed attempts
+            # This prevents creating duplicates on retry
+            if self.supabase:
                 try:
-                    # Reuse existing company ID if available (prevents duplicates on retry)
-                    if existing_company_id:
-                        company_id = existing_company_id
-                        result.company_id = company_id
-                        logger.info(
-                            "🔗 Company reused from previous attempt",
-                            extra=log_domain(DOMAIN_HUBSPOT, "company_reused", company_id=company_id, memo_id=str(memo_id)),
-                        )
-                    else:
-                        company = await self.companies.create_or_update(extraction)
-                        if company:
-                            company_id = company.id
-                            result.company_id = company_id
-                            logger.info(
-                                "✅ Company upserted",
-                                extra=log_domain(DOMAIN_HUBSPOT, "company_upserted", company_id=company_id, company_name=extraction.companyName),
-                            )
-                            await self.crm_updates.create_update(
-                                memo_id=str(memo_id),
-                                user_id=user_id,
-                                crm_connection_id=str(connection_id),
-                                action_type="upsert_company",
-                                resource_type="company",
-                                data={"company_id": company_id, "name": extraction.companyName},
-                            )
-                except Exception as e:
-                    inc_pipeline_error(DOMAIN_HUBSPOT, "company_upsert")
-                    logger.warning(
-                        "⚠️ Company upsert failed",
-                        extra=log_domain(DOMAIN_HUBSPOT, "company_failed", memo_id=str(memo_id), error=str(e)),
+                    # Latest successful company/contact upserts for this memo
+                    existing_company_id, existing_contact_id = (
+                        await self.crm_updates.get_synced_company_contact_ids(memo_id)
                     )
-                    await self.crm_updates.create_update(
-                        memo_id=str(memo_id),
-                        user_id=user_id,
-                        crm_connection_id=str(connection_id),
-                        action_type="upsert_company",
-                        resource_type="company",
-                        data={"error": str(e)},
-                    )
-            
-            # Step 2: Contact (only when user setting allows)
-            # Pull from extraction or raw_extraction (LLM may put in either)
+                except Exception:
+                    # If we can't check, proceed normally (not critical)
+                    pass
+
+            # Contact fields: pull from extraction or raw_extraction (LLM may put in either)
             raw = extraction.raw_extraction or {}
-            company = extraction.companyName or raw.get("companyName") or raw.get("company_name")
-            contact_name = extraction.contactName or raw.get("contactName") or raw.get("contact_name")
-            contact_email = extraction.contactEmail or raw.get("contactEmail") or raw.get("contact_email")
+            company = _first_value(extraction.companyName, raw, "companyName", "company_name")
+            contact_name = _first_value(extraction.contactName, raw, "contactName", "contact_name")
+            contact_email = _first_value(extraction.contactEmail, raw, "contactEmail", "contact_email")
             # Fallback: when we only have company, create "Contact at {company}"
             if company and not contact_name and not contact_email:
                 contact_name = f"Contact at {company}"
-            extraction_for_contact = extraction.model_copy(
-                update={
-                    "companyName": company or extraction.companyName,
-                    "contactName": contact_name or extraction.contactName,
-                    "contactEmail": contact_email or extraction.contactEmail,
-                }
+            # Only copy the extraction when a fallback actually fills something in
+            contact_overrides = {
+                field: value
+                for field, value in (
+                    ("companyName", company),
+                    ("contactName", contact_name),
+                    ("contactEmail", contact_email),
+                )
+                if value and value != getattr(extraction, field)
+            }
+            extraction_for_contact = (
+                extraction.model_copy(update=contact_overrides) if contact_overrides else extraction
             )
-            should_create_contact = create_contacts and (
+            # Step 1: Company (only when crm_config allows and we have company name)
+            should_create_company = bool(create_companies and extraction.companyName)
+            # Step 2: Contact (only when user setting allows)
+            should_create_contact = bool(create_contacts and (
                 extraction_for_contact.contactEmail or extraction_for_contact.contactName
+            ))
+
+            # Steps 1-2 are independent round-trips: run them concurrently
+            company_id, contact_id = await asyncio.gather(
+                self._upsert_company(
+                    extraction, existing_company_id, memo_id, user_id, connection_id,
+                    pending_updates,
+                ) if should_create_company else _completed(existing_company_id),
+                self._upsert_contact(
+                    extraction_for_contact, existing_contact_id, deal_id, is_new_deal,
+                    memo_id, user_id, connection_id, pending_updates,
+                ) if should_create_contact else _completed(existing_contact_id),
             )
+            if should_create_company:
+                result.company_id = company_id
             if should_create_contact:
-                try:
-                    # Reuse existing contact ID if available (prevents duplicates on retry)
-                    if existing_contact_id:
-                        contact_id = existing_contact_id
-                        result.contact_id = contact_id
-                        logger.info(
-                            "🔗 Contact reused from previous attempt",
-                            extra=log_domain(DOMAIN_HUBSPOT, "contact_reused", contact_id=contact_id, memo_id=str(memo_id)),
-                        )
-                    elif deal_id and not is_new_deal:
-                        # UPDATE MODE: Prefer updating deal's existing contact over creating new one
-                        try:
-                            contact_ids = await self.associations.get_associations("deals", deal_id, "contacts")
-                            if contact_ids:
-                                primary_contact_id = contact_ids[0]
-                                props = self.contacts.map_extraction_to_properties(extraction_for_contact)
-                                if props:
-                                    await self.contacts.update(primary_contact_id, props)
-                                    contact_id = primary_contact_id
-                                    result.contact_id = contact_id
-                                    logger.info(
-                                        "✅ Contact updated (deal association)",
-                                        extra=log_domain(DOMAIN_HUBSPOT, "contact_updated", contact_id=primary_contact_id, memo_id=str(memo_id)),
-                                    )
-                                    await self.crm_updates.create_update(
-                                        memo_id=str(memo_id),
-                                        user_id=user_id,
-                                        crm_connection_id=str(connection_id),
-                                        action_type="upsert_contact",
-                                        resource_type="contact",
-                                        data={"contact_id": primary_contact_id, "email": extraction_for_contact.contactEmail},
-                                    )
-                        except Exception as e:
-                            logger.warning(
-                                "⚠️ Failed to update deal contact, will create: %s",
-                                e,
-                                extra=log_domain(DOMAIN_HUBSPOT, "contact_update_fallback", memo_id=str(memo_id)),
-                            )
-                        if not contact_id:
-                            contact = await self.contacts.create_or_update(extraction_for_contact)
-                            if contact:
-                                contact_id = contact.id
-                                result.contact_id = contact_id
-                                logger.info(
-                                    "✅ Contact upserted (fallback)",
-                                    extra=log_domain(DOMAIN_HUBSPOT, "contact_upserted", contact_id=contact_id, memo_id=str(memo_id)),
-                                )
-                                await self.crm_updates.create_update(
-                                    memo_id=str(memo_id),
-                                    user_id=user_id,
-                                    crm_connection_id=str(connection_id),
-                                    action_type="upsert_contact",
-                                    resource_type="contact",
-                                    data={"contact_id": contact_id, "email": extraction_for_contact.contactEmail},
-                                )
-                    else:
-                        contact = await self.contacts.create_or_update(extraction_for_contact)
-                        if contact:
-                            contact_id = contact.id
-                            result.contact_id = contact_id
-                            logger.info(
-                                "✅ Contact upserted",
-                                extra=log_domain(DOMAIN_HUBSPOT, "contact_upserted", contact_id=contact_id, memo_id=str(memo_id), company=extraction_for_contact.companyName, contact_name=extraction_for_contact.contactName),
-                            )
-                            await self.crm_updates.create_update(
-                                memo_id=str(memo_id),
-                                user_id=user_id,
-                                crm_connection_id=str(connection_id),
-                                action_type="upsert_contact",
-                                resource_type="contact",
-                                data={"contact_id": contact_id, "email": extraction_for_contact.contactEmail},
-                            )
-                except Exception as e:
-                    inc_pipeline_error(DOMAIN_HUBSPOT, "contact_upsert")
-                    logger.warning(
-                        "⚠️ Contact upsert failed",
-                        extra=log_domain(DOMAIN_HUBSPOT, "contact_failed", memo_id=str(memo_id), error=str(e), company=extraction_for_contact.companyName, contact=extraction_for_contact.contactName),
-                    )
-                    await self.crm_updates.create_update(
-                        memo_id=str(memo_id),
-                        user_id=user_id,
-                        crm_connection_id=str(connection_id),
-                        action_type="upsert_contact",
-                        resource_type="contact",
-                        data={"error": str(e)},
-                    )
+                result.contact_id = contact_id
             
-            # Step 3: Associate contact → company
+            # Step 3: Associate contact → company (not critical, doesn't affect the
+            # result: runs in the background alongside the deal step)
             if contact_id and company_id:
-                try:
-                    await self.associations.associate_contact_to_company(
-                        contact_id, company_id
-                    )
-                except Exception:
-                    # Log error but continue (association is not critical)
-                    pass
+                self._spawn(self._associate_contact_to_company(contact_id, company_id))
             
+            # Portal lookup (for the deal URL) overlaps with the deal create/update
+            portal_task = asyncio.create_task(self._resolve_portal(connection_id, pending_metadata))
+
             # Step 4: Deal - Create or Update
             try:
                 if deal_id and not is_new_deal:
                     # UPDATE MODE: Merge existing deal with new extraction
-                    # 1. Fetch current deal properties
-                    fetch_props = list(set(
-                        allowed_fields + [
-                            "dealname", "amount", "closedate", "description", "dealstage"
-                        ]
-                    ))
-                    current_deal = await self.deals.get(deal_id, properties=fetch_props)
+                    # 1. Current deal properties (prefetched above)
+                    current_deal, existing_tasks = await deal_prefetch
                     existing_props = current_deal.properties or {}
+                    filtered_properties: dict[str, Any] = {}
 
-                    # 2. Map new extraction to properties (HubSpot format)
-                    # Use extraction-based deal name when existing is generic ("New Deal", etc.)
-                    existing_dealname = (existing_props.get("dealname") or "").strip().lower()
-                    generic_names = ("new deal", "nuevo deal", "deal", "")
-                    deal_name_arg = None if existing_dealname in generic_names else existing_props.get("dealname")
-                    new_properties = await self.deals.map_extraction_to_properties_with_stage(
-                        extraction,
-                        deal_name=deal_name_arg,
-                    )
+                    if has_deal_updates:
+                        # 2. Map new extraction to properties (HubSpot format)
+                        # Use extraction-based deal name when existing is generic ("New Deal", etc.)
+                        existing_dealname = (existing_props.get("dealname") or "").strip().lower()
+                        deal_name_arg = None if existing_dealname in GENERIC_DEAL_NAMES else existing_props.get("dealname")
+                        new_properties = await self.deals.map_extraction_to_properties_with_stage(
+                            extraction,
+                            deal_name=deal_name_arg,
+                            allowed=updatable_fields,
+                        )
 
-                    # 3. Merge: deterministic (user-approved values; no LLM)
-                    merge_svc = DealMergeService()
-                    merged_properties = merge_svc.merge_properties(
-                        existing_properties=existing_props,
-                        new_properties=new_properties,
-                        allowed_fields=allowed_fields,
-                        transcript=transcript,
-                    )
+                        # 3. Merge: deterministic (user-approved values; no LLM)
+                        merge_svc = DealMergeService()
+                        merged_properties = merge_svc.merge_properties(
+                            existing_properties=existing_props,
+                            new_properties=new_properties,
+                            allowed_fields=allowed_fields,
+                            transcript=transcript,
+                        )
 
-                    # 4. Filter to allowed fields (safety)
-                    filtered_properties = self._filter_properties(
-                        merged_properties, allowed_fields
-                    )
-                    # Never overwrite deal identity when updating existing deal
-                    # (e.g. extension recorded on known HubSpot deal page)
-                    filtered_properties = {
-                        k: v for k, v in filtered_properties.items()
-                        if k not in FIELDS_PRESERVED_WHEN_UPDATING_EXISTING_DEAL
-                    }
+                        # 4. Filter to allowed fields (safety), never overwriting deal identity
+                        # when updating existing deal (e.g. extension recorded on known HubSpot
+                        # deal page), and only send values that differ from the deal as stored
+                        filtered_properties = self._filter_properties(
+                            merged_properties,
+                            updatable_fields,
+                            existing_properties=existing_props,
+                        )
 
                     if not filtered_properties:
                         # No changes to apply - still success
                         result.deal_id = deal_id
                         result.deal_name = existing_props.get("dealname") or "Deal"
+                        logger.info(
+                            "ℹ️ Deal unchanged, skipping update",
+                            extra=log_domain(DOMAIN_HUBSPOT, "deal_update_noop", deal_id=deal_id, memo_id=memo_id),
+                        )
                     else:
                         # Update deal with merged properties
                         deal = await self.deals.update(
                             deal_id,
                             filtered_properties,
-                            hubspot_owner_id=hubspot_owner_id,
+                            hubspot_owner_id=await owner_task,
                         )
                         result.deal_id = deal.id
-                        await self.crm_updates.create_update(
-                            memo_id=str(memo_id),
+                        pending_updates.append(self.crm_updates.build_update(
+                            memo_id=memo_id,
                             user_id=user_id,
-                            crm_connection_id=str(connection_id),
+                            crm_connection_id=connection_id,
                             action_type="update_deal",
                             resource_type="deal",
                             data={
                                 "deal_id": deal.id,
                                 "updated_fields": list(filtered_properties.keys()),
                             },
-                        )
+                        ))
                         logger.info(
                             "✅ Deal updated",
-                            extra=log_domain(DOMAIN_HUBSPOT, "deal_updated", deal_id=deal.id, memo_id=str(memo_id), updated_fields=list(filtered_properties.keys())),
+                            extra=log_domain(DOMAIN_HUBSPOT, "deal_updated", deal_id=deal.id, memo_id=memo_id, updated_fields=list(filtered_properties.keys())),
                         )
                     result.deal_name = existing_props.get("dealname") or "Deal"
                 else:
@@ -502,14 +741,15 @@ class HubSpotSyncService:
                         extraction,
                         contact_id=contact_id,
                         company_id=company_id,
-                        hubspot_owner_id=hubspot_owner_id,
+                        hubspot_owner_id=await owner_task,
                     )
                     result.deal_id = deal.id
+                    deal_created = True
                     
-                    await self.crm_updates.create_update(
-                        memo_id=str(memo_id),
+                    pending_updates.append(self.crm_updates.build_update(
+                        memo_id=memo_id,
                         user_id=user_id,
-                        crm_connection_id=str(connection_id),
+                        crm_connection_id=connection_id,
                         action_type="create_deal",
                         resource_type="deal",
                         data={
@@ -517,10 +757,10 @@ class HubSpotSyncService:
                             "amount": extraction.dealAmount,
                             "stage": extraction.dealStage,
                         },
-                    )
+                    ))
                     logger.info(
                         "✅ Deal created",
-                        extra=log_domain(DOMAIN_HUBSPOT, "deal_created", deal_id=deal.id, memo_id=str(memo_id), amount=extraction.dealAmount, stage=extraction.dealStage),
+                        extra=log_domain(DOMAIN_HUBSPOT, "deal_created", deal_id=deal.id, memo_id=memo_id, amount=extraction.dealAmount, stage=extraction.dealStage, contact_id=contact_id, company_id=company_id),
                     )
                     result.deal_name = (deal.properties or {}).get("dealname") or extraction.companyName or "Deal"
 
@@ -536,16 +776,16 @@ class HubSpotSyncService:
                     "❌ Deal %s failed: %s",
                     action,
                     str(e),
-                    extra=log_domain(DOMAIN_HUBSPOT, f"deal_{action}_failed", memo_id=str(memo_id), error=str(e)),
+                    extra=log_domain(DOMAIN_HUBSPOT, f"deal_{action}_failed", memo_id=memo_id, error=str(e)),
                 )
-                await self.crm_updates.create_update(
-                    memo_id=str(memo_id),
+                pending_updates.append(self.crm_updates.build_update(
+                    memo_id=memo_id,
                     user_id=user_id,
-                    crm_connection_id=str(connection_id),
+                    crm_connection_id=connection_id,
                     action_type=f"{action}_deal",
                     resource_type="deal",
                     data={"error": str(e)},
-                )
+                ))
                 return result
             
             # Step 4b: UPDATE MODE - Update deal's primary contact when extraction has contact info but no email
@@ -564,172 +804,37 @@ class HubSpotSyncService:
                                 result.contact_id = primary_contact_id
                                 logger.info(
                                     "✅ Contact updated (deal association)",
-                                    extra=log_domain(DOMAIN_HUBSPOT, "contact_updated", contact_id=primary_contact_id, memo_id=str(memo_id)),
+                                    extra=log_domain(DOMAIN_HUBSPOT, "contact_updated", contact_id=primary_contact_id, memo_id=memo_id),
                                 )
                     except Exception as e:
                         logger.warning(
                             "⚠️ Failed to update deal contact: %s",
                             e,
-                            extra=log_domain(DOMAIN_HUBSPOT, "contact_update_failed", memo_id=str(memo_id), error=str(e)),
+                            extra=log_domain(DOMAIN_HUBSPOT, "contact_update_failed", memo_id=memo_id, error=str(e)),
                         )
 
-            # Step 5: Associate deal → contact, deal → company (always when we have them)
-            # Applies to both new deals and existing deals being updated
-            if deal_id and contact_id:
-                try:
-                    await self.associations.associate_deal_to_contact(deal_id, contact_id)
-                    logger.info(
-                        "✅ Associations done: deal to contact",
-                        extra=log_domain(DOMAIN_HUBSPOT, "associations_done", deal_id=deal_id, contact_id=contact_id),
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to associate deal %s to contact %s: %s. "
-                        "Ensure crm.objects.contacts.write and crm.objects.deals.write scopes.",
-                        deal_id, contact_id, e,
-                    )
-
-            if deal_id and company_id:
-                try:
-                    await self.associations.associate_deal_to_company(deal_id, company_id)
-                    logger.info(
-                        "✅ Associations done: deal to company",
-                        extra=log_domain(DOMAIN_HUBSPOT, "associations_done", deal_id=deal_id, company_id=company_id),
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to associate deal %s to company %s: %s",
-                        deal_id, company_id, e,
-                        extra=log_domain(DOMAIN_HUBSPOT, "association_failed", deal_id=deal_id, company_id=company_id),
-                    )
-
-            # Step 6: Tasks - merge with existing when updating deal, else create new
-            if deal_id and extraction.nextSteps:
-                try:
-                    used_merge = False
-                    if not is_new_deal:
-                        # UPDATE MODE: Fetch existing tasks, merge with new extraction
-                        existing_tasks = await self.tasks.list_tasks_for_deal(deal_id)
-                        if existing_tasks:
-                            merge_svc = TaskMergeService()
-                            merge_result = await merge_svc.merge_tasks(
-                                existing_tasks=existing_tasks,
-                                extraction=extraction,
-                                transcript=transcript,
-                            )
-                            created_ids = []
-                            # Execute add
-                            for add_op in merge_result.add:
-                                due = add_op.due_date or _parse_date_from_text(add_op.subject) or (
-                                    datetime.now(timezone.utc) + timedelta(days=3)
-                                )
-                                tid = await self.tasks.create_task(
-                                    subject=add_op.subject,
-                                    due_date=due,
-                                    deal_id=deal_id,
-                                    body=extraction.summary or "",
-                                    hubspot_owner_id=hubspot_owner_id,
-                                )
-                                if tid:
-                                    created_ids.append(tid)
-                            # Execute update
-                            for upd_op in merge_result.update:
-                                await self.tasks.update_task(
-                                    task_id=upd_op.id,
-                                    subject=upd_op.subject,
-                                    due_date=upd_op.due_date,
-                                    hubspot_owner_id=hubspot_owner_id,
-                                )
-                            # Execute delete
-                            for del_id in merge_result.delete:
-                                await self.tasks.delete_task(del_id)
-                            if created_ids or merge_result.update or merge_result.delete:
-                                await self.crm_updates.create_update(
-                                    memo_id=str(memo_id),
-                                    user_id=user_id,
-                                    crm_connection_id=str(connection_id),
-                                    action_type="merge_tasks",
-                                    resource_type="task",
-                                    data={
-                                        "task_ids": created_ids,
-                                        "updated": [u.id for u in merge_result.update],
-                                        "deleted": merge_result.delete,
-                                    },
-                                )
-                            used_merge = True
-                    if not used_merge:
-                        # CREATE MODE or no existing tasks: create from extraction
-                        task_ids = await self.tasks.create_tasks_from_extraction(
-                            extraction,
-                            deal_id=deal_id,
-                            hubspot_owner_id=hubspot_owner_id,
-                        )
-                        if task_ids:
-                            logger.info(
-                                "✅ Tasks created",
-                                extra=log_domain(DOMAIN_HUBSPOT, "tasks_created", deal_id=deal_id, count=len(task_ids), task_ids=task_ids),
-                            )
-                            await self.crm_updates.create_update(
-                                memo_id=str(memo_id),
-                                user_id=user_id,
-                                crm_connection_id=str(connection_id),
-                                action_type="create_tasks",
-                                resource_type="task",
-                                data={"task_ids": task_ids, "count": len(task_ids)},
-                            )
-                except Exception as e:
-                    inc_pipeline_error(DOMAIN_HUBSPOT, "create_tasks")
-                    logger.warning(
-                        "Failed to create tasks for deal %s: %s", deal_id, e,
-                        extra=log_domain(DOMAIN_HUBSPOT, "tasks_failed", deal_id=deal_id, error=str(e)),
-                    )
-
-            # Step 7: Create note with transcript for deal context
-            if deal_id and transcript and transcript.strip():
-                try:
-                    note_body = transcript.strip()
-                    if len(note_body) > 65536:
-                        note_body = note_body[:65533] + "..."
-                    note_payload = {
-                        "properties": {
-                            "hs_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                            "hs_note_body": note_body,
-                        },
-                        "associations": [
-                            {
-                                "to": {"id": str(deal_id)},
-                                "types": [
-                                    {
-                                        "associationCategory": "HUBSPOT_DEFINED",
-                                        "associationTypeId": 214,
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                    if hubspot_owner_id:
-                        note_payload["properties"]["hubspot_owner_id"] = hubspot_owner_id
-                    await self.client.post("/crm/v3/objects/notes", data=note_payload)
-                    logger.info(
-                        "✅ Note created",
-                        extra=log_domain(DOMAIN_HUBSPOT, "note_created", deal_id=deal_id),
-                    )
-                    await self.crm_updates.create_update(
-                        memo_id=str(memo_id),
-                        user_id=user_id,
-                        crm_connection_id=str(connection_id),
-                        action_type="create_note",
-                        resource_type="note",
-                        data={"deal_id": deal_id},
-                    )
-                except Exception as e:
-                    inc_pipeline_error(DOMAIN_HUBSPOT, "create_note")
-                    logger.warning(
-                        "Failed to create transcript note for deal %s: %s. "
-                        "Ensure crm.objects.notes.write scope.",
-                        deal_id, e,
-                        extra=log_domain(DOMAIN_HUBSPOT, "note_failed", deal_id=deal_id, error=str(e)),
-                    )
+            # Steps 5-7 don't change the result: run them in the background so the
+            # caller gets the synced deal without waiting on them. Record Steps 1-4
+            # first: a retry looks up the company/contact IDs in these rows
+            if deal_id:
+                await self._flush_updates(pending_updates, memo_id)
+                pending_updates = []
+                self._spawn(self._post_deal_work(
+                    deal_id=deal_id,
+                    contact_id=contact_id,
+                    company_id=company_id,
+                    extraction=extraction,
+                    is_new_deal=is_new_deal,
+                    owner_task=owner_task,
+                    transcript=transcript,
+                    memo_id=memo_id,
+                    user_id=user_id,
+                    connection_id=connection_id,
+                    existing_tasks=existing_tasks,
+                    # A created deal got its contact/company associations in the create request
+                    associations_done=deal_created,
+                ))
+                owner_task = None  # awaited by the background steps; don't cancel it
             
             # Success!
             result.success = True
@@ -737,58 +842,31 @@ class HubSpotSyncService:
             record_sync_duration(elapsed, "success")
             logger.info(
                 "✅ HubSpot sync complete",
-                extra=log_domain(DOMAIN_HUBSPOT, "sync_complete", memo_id=str(memo_id), deal_id=result.deal_id, company_id=result.company_id, contact_id=result.contact_id, duration_ms=round(elapsed * 1000, 2)),
+                extra=log_domain(DOMAIN_HUBSPOT, "sync_complete", memo_id=memo_id, deal_id=result.deal_id, company_id=result.company_id, contact_id=result.contact_id, duration_ms=round(elapsed * 1000, 2)),
             )
             
-            # Generate deal URL for frontend (deal_name set during create/update)
+            # Generate deal URL for frontend (deal_name is always set by create/update
+            # from the create response or the fetched deal: no extra GET)
             if deal_id:
-                if not result.deal_name:
-                    try:
-                        deal_obj = await self.deals.get(deal_id, properties=["dealname"])
-                        result.deal_name = (deal_obj.properties or {}).get("dealname") or "Deal"
-                    except Exception:
-                        result.deal_name = extraction.companyName or "Deal"
-
-                portal_id = None
-                region = "na1"
-                metadata = {}
-                
-                # Try connection metadata first
-                if self.supabase:
-                    conn = self.supabase.table("crm_connections").select("metadata").eq("id", str(connection_id)).single().execute()
-                    if conn.data:
-                        metadata = conn.data.get("metadata", {}) or {}
-                        portal_id = metadata.get("portal_id")
-                        region = metadata.get("region", "na1")
-                
-                # Fallback: fetch portal_id from HubSpot API (e.g. old connections without metadata)
-                if not portal_id:
-                    try:
-                        account_info = await self.client.get("/integrations/v1/me")
-                        if account_info:
-                            portal_id = str(account_info.get("portalId", ""))
-                            # Update connection metadata for future syncs
-                            if portal_id and self.supabase:
-                                self.supabase.table("crm_connections").update({
-                                    "metadata": {**metadata, "portal_id": portal_id, "region": region}
-                                }).eq("id", str(connection_id)).execute()
-                    except Exception:
-                        pass
+                portal_id, region = await portal_task
                 
                 if portal_id:
-                    region_prefix = f"-{region}" if region != "na1" else ""
-                    result.deal_url = f"https://app{region_prefix}.hubspot.com/contacts/{portal_id}/record/0-3/{deal_id}"
+                    result.deal_url = _deal_url_prefix(str(portal_id), region) + str(deal_id)
             
         except HubSpotAuthError as e:
+            # Token no longer valid: don't trust anything cached for this connection
+            invalidate_connection_metadata(connection_id)
             result.error = f"HubSpot authentication failed: {e.message}"
             result.error_code = "AUTH_ERROR"
             record_sync_duration(time.perf_counter() - t0, "failure")
             inc_pipeline_error(DOMAIN_HUBSPOT, "auth_error")
             logger.error(
                 "❌ Sync failed: auth error",
-                extra=log_domain(DOMAIN_HUBSPOT, "sync_failed", memo_id=str(memo_id), error=str(e.message)),
+                extra=log_domain(DOMAIN_HUBSPOT, "sync_failed", memo_id=memo_id, error=str(e.message)),
             )
         except HubSpotScopeError as e:
+            # Scopes may change on reconnect: re-read metadata and owners next time
+            invalidate_connection_metadata(connection_id)
             result.error = f"Missing HubSpot permissions: {e.message}"
             if e.required_scope:
                 result.error += f" Required scope: {e.required_scope}"
@@ -797,7 +875,7 @@ class HubSpotSyncService:
             inc_pipeline_error(DOMAIN_HUBSPOT, "scope_error")
             logger.error(
                 "❌ Sync failed: scope error",
-                extra=log_domain(DOMAIN_HUBSPOT, "sync_failed", memo_id=str(memo_id), error=str(e.message)),
+                extra=log_domain(DOMAIN_HUBSPOT, "sync_failed", memo_id=memo_id, error=str(e.message)),
             )
         except HubSpotError as e:
             result.error = f"HubSpot API error: {e.message}"
@@ -806,7 +884,7 @@ class HubSpotSyncService:
             inc_pipeline_error(DOMAIN_HUBSPOT, "api_error")
             logger.error(
                 "❌ Sync failed: API error",
-                extra=log_domain(DOMAIN_HUBSPOT, "sync_failed", memo_id=str(memo_id), error=str(e.message)),
+                extra=log_domain(DOMAIN_HUBSPOT, "sync_failed", memo_id=memo_id, error=str(e.message)),
             )
         except Exception as e:
             result.error = f"Unexpected error: {str(e)}"
@@ -815,8 +893,601 @@ class HubSpotSyncService:
             inc_pipeline_error(DOMAIN_HUBSPOT, "unknown_error")
             logger.exception(
                 "❌ Sync failed: unexpected error",
-                extra=log_domain(DOMAIN_HUBSPOT, "sync_failed", memo_id=str(memo_id), error=str(e)),
+                extra=log_domain(DOMAIN_HUBSPOT, "sync_failed", memo_id=memo_id, error=str(e)),
             )
+        finally:
+            for pending_task in (owner_task, portal_task, deal_prefetch):
+                if pending_task and not pending_task.done():
+                    pending_task.cancel()
+                elif pending_task and not pending_task.cancelled():
+                    # Mark a failure nobody awaited (e.g. prefetch during a scope error) as seen
+                    pending_task.exception()
+            await self._flush_updates(pending_updates, memo_id)
+            if pending_metadata and self.supabase:
+                try:
+                    await asyncio.to_thread(
+                        _merge_connection_metadata, self.supabase, connection_id, pending_metadata
+                    )
+                except Exception as e:
+                    logger.warning("Failed to update metadata for connection %s: %s", connection_id, e)
         
         return result
 
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        for tasks in (self._background, _background_tasks):
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        return task
+
+    async def drain(self) -> None:
+        """Wait for background work started by this instance (process-wide: drain_background_sync)."""
+        while self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    async def _prefetch_deal_tasks(self, deal_id: str, memo_id: str) -> Optional[list[dict]]:
+        """
+        List the deal's tasks alongside the deal fetch. Never raises: a failure only
+        affects Step 6, which gets None and lists the tasks itself.
+        """
+        try:
+            return await self.tasks.list_tasks_for_deal(deal_id)
+        except Exception as e:
+            logger.warning(
+                "Task prefetch failed for deal %s: %s", deal_id, e,
+                extra=log_domain(DOMAIN_HUBSPOT, "task_prefetch_failed", deal_id=deal_id, memo_id=memo_id, error=str(e)),
+            )
+            return None
+
+    async def _associate_contact_to_company(self, contact_id: str, company_id: str) -> None:
+        """Step 3: associate contact → company; failures are logged and ignored."""
+        try:
+            await self.associations.associate_contact_to_company(contact_id, company_id)
+        except Exception as e:
+            logger.debug("Contact → company association failed: %s", e)
+
+    async def _post_deal_work(
+        self,
+        deal_id: str,
+        contact_id: Optional[str],
+        company_id: Optional[str],
+        extraction: MemoExtraction,
+        is_new_deal: bool,
+        owner_task: asyncio.Future,
+        transcript: Optional[str],
+        memo_id: str,
+        user_id: str,
+        connection_id: str,
+        existing_tasks: Optional[list[dict]] = None,
+        associations_done: bool = False,
+    ) -> None:
+        """
+        Steps 5-7 (associations, tasks, transcript note), then write their crm_updates rows.
+        
+        Runs in the background once the deal exists. The three steps only need
+        the deal ID, so they run concurrently; each logs and swallows its own
+        failures. existing_tasks may be prefetched by the caller (update mode);
+        otherwise they are listed here. associations_done skips Step 5 when the
+        deal was created with its associations. Only Steps 6-7 wait for owner_task.
+        """
+        owner = asyncio.ensure_future(self._await_owner(owner_task, user_id))
+        pending_updates: list[dict[str, Any]] = []
+
+        async def tasks_step() -> None:
+            await self._sync_tasks(
+                deal_id, extraction, is_new_deal, await owner, transcript,
+                memo_id, user_id, connection_id, pending_updates, existing_tasks,
+            )
+
+        async def note_step() -> None:
+            await self._create_transcript_note(
+                deal_id, transcript, await owner, memo_id, user_id, connection_id, pending_updates,
+            )
+
+        try:
+            await asyncio.gather(
+                # Step 5: Associate deal → contact, deal → company (existing deals being
+                # updated; new deals are created with these associations)
+                self._associate_deal(deal_id, contact_id, company_id)
+                if not associations_done and (contact_id or company_id) else _completed(None),
+                # Step 6: Tasks - merge with existing when updating deal, else create new
+                tasks_step() if extraction.nextSteps else _completed(None),
+                # Step 7: Create note with transcript for deal context
+                note_step() if transcript else _completed(None),
+            )
+        except Exception as e:
+            logger.exception(
+                "❌ Post-deal sync steps failed",
+                extra=log_domain(DOMAIN_HUBSPOT, "post_deal_failed", memo_id=memo_id, deal_id=deal_id, error=str(e)),
+            )
+        finally:
+            await self._flush_updates(pending_updates, memo_id)
+
+    @staticmethod
+    async def _await_owner(owner_task: asyncio.Future, user_id: str) -> Optional[str]:
+        """Wait for owner resolution and log the outcome (None when it failed)."""
+        try:
+            hubspot_owner_id = await owner_task
+        except Exception as e:
+            logger.warning("Could not resolve HubSpot owner for user %s: %s", user_id, e)
+            return None
+        if hubspot_owner_id:
+            logger.info(
+                "✅ Resolved HubSpot owner",
+                extra=log_domain(DOMAIN_HUBSPOT, "owner_resolved", hubspot_owner_id=hubspot_owner_id, user_id=user_id),
+            )
+        else:
+            logger.info(
+                "⚠️ No HubSpot owner matched",
+                extra=log_domain(DOMAIN_HUBSPOT, "owner_not_matched", user_id=user_id),
+            )
+        return hubspot_owner_id
+
+    async def _associate_deal(
+        self,
+        deal_id: str,
+        contact_id: Optional[str],
+        company_id: Optional[str],
+    ) -> None:
+        """Step 5: associate deal → contact and deal → company; failures are logged."""
+        assoc_errors = await self.associations.batch_associate_deal(
+            deal_id,
+            contact_ids=[contact_id] if contact_id else None,
+            company_ids=[company_id] if company_id else None,
+        )
+        if contact_id:
+            e = assoc_errors.get("contacts")
+            if e is None:
+                logger.info(
+                    "✅ Associations done: deal to contact",
+                    extra=log_domain(DOMAIN_HUBSPOT, "associations_done", deal_id=deal_id, contact_id=contact_id),
+                )
+            else:
+                logger.warning(
+                    "Failed to associate deal %s to contact %s: %s. "
+                    "Ensure crm.objects.contacts.write and crm.objects.deals.write scopes.",
+                    deal_id, contact_id, e,
+                )
+        if company_id:
+            e = assoc_errors.get("companies")
+            if e is None:
+                logger.info(
+                    "✅ Associations done: deal to company",
+                    extra=log_domain(DOMAIN_HUBSPOT, "associations_done", deal_id=deal_id, company_id=company_id),
+                )
+            else:
+                logger.warning(
+                    "Failed to associate deal %s to company %s: %s",
+                    deal_id, company_id, e,
+                    extra=log_domain(DOMAIN_HUBSPOT, "association_failed", deal_id=deal_id, company_id=company_id),
+                )
+
+    async def _sync_tasks(
+        self,
+        deal_id: str,
+        extraction: MemoExtraction,
+        is_new_deal: bool,
+        hubspot_owner_id: Optional[str],
+        transcript: Optional[str],
+        memo_id: str,
+        user_id: str,
+        connection_id: str,
+        pending_updates: list[dict[str, Any]],
+        existing_tasks: Optional[list[dict]] = None,
+    ) -> None:
+        """Step 6: merge next steps into the deal's tasks, or create them; failures are logged."""
+        try:
+            if not is_new_deal and existing_tasks is None:
+                existing_tasks = await self.tasks.list_tasks_for_deal(deal_id)
+            if not is_new_deal and existing_tasks:
+                # UPDATE MODE: merge new extraction with the deal's existing tasks
+                await self._merge_deal_tasks(
+                    deal_id, existing_tasks, extraction, hubspot_owner_id, transcript,
+                    memo_id, user_id, connection_id, pending_updates,
+                )
+                return
+
+            # CREATE MODE or no existing tasks: create from extraction
+            task_ids = await self.tasks.create_tasks_from_extraction(
+                extraction,
+                deal_id=deal_id,
+                hubspot_owner_id=hubspot_owner_id,
+            )
+            if not task_ids:
+                return
+            logger.info(
+                "✅ Tasks created",
+                extra=log_domain(DOMAIN_HUBSPOT, "tasks_created", deal_id=deal_id, count=len(task_ids), task_ids=task_ids),
+            )
+            pending_updates.append(self.crm_updates.build_update(
+                memo_id=memo_id,
+                user_id=user_id,
+                crm_connection_id=connection_id,
+                action_type="create_tasks",
+                resource_type="task",
+                data={"task_ids": task_ids, "count": len(task_ids)},
+            ))
+        except Exception as e:
+            inc_pipeline_error(DOMAIN_HUBSPOT, "create_tasks")
+            logger.warning(
+                "Failed to create tasks for deal %s: %s", deal_id, e,
+                extra=log_domain(DOMAIN_HUBSPOT, "tasks_failed", deal_id=deal_id, error=str(e)),
+            )
+
+    async def _merge_deal_tasks(
+        self,
+        deal_id: str,
+        existing_tasks: list[dict],
+        extraction: MemoExtraction,
+        hubspot_owner_id: Optional[str],
+        transcript: Optional[str],
+        memo_id: str,
+        user_id: str,
+        connection_id: str,
+        pending_updates: list[dict[str, Any]],
+    ) -> None:
+        """Step 6, update mode: merge next steps into existing tasks (raises on failure)."""
+        merge_result = await TaskMergeService().merge_tasks(
+            existing_tasks=existing_tasks,
+            extraction=extraction,
+            transcript=transcript,
+        )
+        # Execute add, update and delete as one batch request each
+        now = datetime.now(timezone.utc)
+        default_due = now + timedelta(days=3)
+        created_ids, updated_ids, deleted_ids = await asyncio.gather(
+            self.tasks.create_tasks_batch(
+                [
+                    (add_op.subject, add_op.due_date or _parse_date_from_text(add_op.subject, now) or default_due)
+                    for add_op in merge_result.add
+                ],
+                deal_id=deal_id,
+                body=extraction.summary or "",
+                hubspot_owner_id=hubspot_owner_id,
+            ) if merge_result.add else _completed([]),
+            self.tasks.update_tasks_batch(
+                [(u.id, u.subject, u.due_date) for u in merge_result.update],
+                hubspot_owner_id=hubspot_owner_id,
+            ) if merge_result.update else _completed([]),
+            self.tasks.delete_tasks_batch(
+                merge_result.delete,
+            ) if merge_result.delete else _completed([]),
+        )
+        # Record only the operations HubSpot accepted
+        if not (created_ids or updated_ids or deleted_ids):
+            return
+        pending_updates.append(self.crm_updates.build_update(
+            memo_id=memo_id,
+            user_id=user_id,
+            crm_connection_id=connection_id,
+            action_type="merge_tasks",
+            resource_type="task",
+            data={
+                "task_ids": created_ids,
+                "updated": updated_ids,
+                "deleted": deleted_ids,
+            },
+        ))
+
+    async def _create_transcript_note(
+        self,
+        deal_id: str,
+        transcript: str,
+        hubspot_owner_id: Optional[str],
+        memo_id: str,
+        user_id: str,
+        connection_id: str,
+        pending_updates: list[dict[str, Any]],
+    ) -> None:
+        """Step 7: add the transcript as a note on the deal; failures are logged."""
+        note_body = _prepare_note_body(transcript)
+        if not note_body:
+            return
+        try:
+            note_payload = {
+                "properties": {
+                    # Epoch milliseconds, as for tasks (no datetime formatting)
+                    "hs_timestamp": str(int(time.time() * 1000)),
+                    "hs_note_body": note_body,
+                },
+                "associations": [
+                    {"to": {"id": str(deal_id)}, "types": NOTE_TO_DEAL_ASSOCIATION_TYPES},
+                ],
+            }
+            if hubspot_owner_id:
+                note_payload["properties"]["hubspot_owner_id"] = hubspot_owner_id
+            await self.client.post("/crm/v3/objects/notes", data=note_payload)
+            logger.info(
+                "✅ Note created",
+                extra=log_domain(DOMAIN_HUBSPOT, "note_created", deal_id=deal_id),
+            )
+            pending_updates.append(self.crm_updates.build_update(
+                memo_id=memo_id,
+                user_id=user_id,
+                crm_connection_id=connection_id,
+                action_type="create_note",
+                resource_type="note",
+                data={"deal_id": deal_id},
+            ))
+        except Exception as e:
+            inc_pipeline_error(DOMAIN_HUBSPOT, "create_note")
+            logger.warning(
+                "Failed to create transcript note for deal %s: %s. "
+                "Ensure crm.objects.notes.write scope.",
+                deal_id, e,
+                extra=log_domain(DOMAIN_HUBSPOT, "note_failed", deal_id=deal_id, error=str(e)),
+            )
+
+    async def _flush_updates(self, pending_updates: list[dict[str, Any]], memo_id: str) -> None:
+        """
+        Write collected crm_updates rows in a single insert; never fails the sync.
+        
+        If the batch is rejected (e.g. one row violates a constraint), falls back to
+        one insert per row so the valid rows are still recorded.
+        """
+        if not pending_updates:
+            return
+        try:
+            await self.crm_updates.create_updates(pending_updates)
+            return
+        except Exception as e:
+            if len(pending_updates) == 1:
+                failed = [(pending_updates[0], e)]
+            else:
+                failed = []
+                for update in pending_updates:
+                    try:
+                        await self.crm_updates.create_updates([update])
+                    except Exception as row_error:
+                        failed.append((update, row_error))
+        for update, e in failed:
+            inc_pipeline_error(DOMAIN_HUBSPOT, "crm_updates")
+            logger.warning(
+                "Failed to record CRM update %s for memo %s: %s",
+                update.get("action_type"), memo_id, e,
+                extra=log_domain(DOMAIN_HUBSPOT, "crm_updates_failed", memo_id=memo_id, error=str(e)),
+            )
+
+    async def _upsert_company(
+        self,
+        extraction: MemoExtraction,
+        existing_company_id: Optional[str],
+        memo_id: str,
+        user_id: str,
+        connection_id: str,
+        pending_updates: list[dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Step 1: Find or create the company and track it in crm_updates.
+        
+        Returns:
+            Company ID (reused, created or updated), or None if the upsert failed
+        """
+        company_id = existing_company_id
+        try:
+            # Reuse existing company ID if available (prevents duplicates on retry)
+            if existing_company_id:
+                logger.info(
+                    "🔗 Company reused from previous attempt",
+                    extra=log_domain(DOMAIN_HUBSPOT, "company_reused", company_id=company_id, memo_id=memo_id),
+                )
+            else:
+                company = await self.companies.create_or_update(extraction)
+                if company:
+                    company_id = company.id
+                    logger.info(
+                        "✅ Company upserted",
+                        extra=log_domain(DOMAIN_HUBSPOT, "company_upserted", company_id=company_id, company_name=extraction.companyName),
+                    )
+                    pending_updates.append(self.crm_updates.build_update(
+                        memo_id=memo_id,
+                        user_id=user_id,
+                        crm_connection_id=connection_id,
+                        action_type="upsert_company",
+                        resource_type="company",
+                        data={"company_id": company_id, "name": extraction.companyName},
+                    ))
+        except Exception as e:
+            inc_pipeline_error(DOMAIN_HUBSPOT, "company_upsert")
+            logger.warning(
+                "⚠️ Company upsert failed",
+                extra=log_domain(DOMAIN_HUBSPOT, "company_failed", memo_id=memo_id, error=str(e)),
+            )
+            pending_updates.append(self.crm_updates.build_update(
+                memo_id=memo_id,
+                user_id=user_id,
+                crm_connection_id=connection_id,
+                action_type="upsert_company",
+                resource_type="company",
+                data={"error": str(e)},
+            ))
+        return company_id
+
+    async def _upsert_contact(
+        self,
+        extraction_for_contact: MemoExtraction,
+        existing_contact_id: Optional[str],
+        deal_id: Optional[str],
+        is_new_deal: bool,
+        memo_id: str,
+        user_id: str,
+        connection_id: str,
+        pending_updates: list[dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Step 2: Find or create the contact and track it in crm_updates.
+        
+        In update mode the deal's primary contact is updated in place when possible.
+        
+        Returns:
+            Contact ID (reused, created or updated), or None if the upsert failed
+        """
+        contact_id = existing_contact_id
+        try:
+            # Reuse existing contact ID if available (prevents duplicates on retry)
+            if existing_contact_id:
+                logger.info(
+                    "🔗 Contact reused from previous attempt",
+                    extra=log_domain(DOMAIN_HUBSPOT, "contact_reused", contact_id=contact_id, memo_id=memo_id),
+                )
+            elif deal_id and not is_new_deal:
+                # UPDATE MODE: Prefer updating deal's existing contact over creating new one
+                try:
+                    contact_ids = await self.associations.get_associations("deals", deal_id, "contacts")
+                    if contact_ids:
+                        primary_contact_id = contact_ids[0]
+                        props = self.contacts.map_extraction_to_properties(extraction_for_contact)
+                        if props:
+                            await self.contacts.update(primary_contact_id, props)
+                            contact_id = primary_contact_id
+                            logger.info(
+                                "✅ Contact updated (deal association)",
+                                extra=log_domain(DOMAIN_HUBSPOT, "contact_updated", contact_id=primary_contact_id, memo_id=memo_id),
+                            )
+                            pending_updates.append(self.crm_updates.build_update(
+                                memo_id=memo_id,
+                                user_id=user_id,
+                                crm_connection_id=connection_id,
+                                action_type="upsert_contact",
+                                resource_type="contact",
+                                data={"contact_id": primary_contact_id, "email": extraction_for_contact.contactEmail},
+                            ))
+                except Exception as e:
+                    logger.warning(
+                        "⚠️ Failed to update deal contact, will create: %s",
+                        e,
+                        extra=log_domain(DOMAIN_HUBSPOT, "contact_update_fallback", memo_id=memo_id),
+                    )
+                if not contact_id:
+                    contact = await self.contacts.create_or_update(extraction_for_contact)
+                    if contact:
+                        contact_id = contact.id
+                        logger.info(
+                            "✅ Contact upserted (fallback)",
+                            extra=log_domain(DOMAIN_HUBSPOT, "contact_upserted", contact_id=contact_id, memo_id=memo_id),
+                        )
+                        pending_updates.append(self.crm_updates.build_update(
+                            memo_id=memo_id,
+                            user_id=user_id,
+                            crm_connection_id=connection_id,
+                            action_type="upsert_contact",
+                            resource_type="contact",
+                            data={"contact_id": contact_id, "email": extraction_for_contact.contactEmail},
+                        ))
+            else:
+                contact = await self.contacts.create_or_update(extraction_for_contact)
+                if contact:
+                    contact_id = contact.id
+                    logger.info(
+                        "✅ Contact upserted",
+                        extra=log_domain(DOMAIN_HUBSPOT, "contact_upserted", contact_id=contact_id, memo_id=memo_id, company=extraction_for_contact.companyName, contact_name=extraction_for_contact.contactName),
+                    )
+                    pending_updates.append(self.crm_updates.build_update(
+                        memo_id=memo_id,
+                        user_id=user_id,
+                        crm_connection_id=connection_id,
+                        action_type="upsert_contact",
+                        resource_type="contact",
+                        data={"contact_id": contact_id, "email": extraction_for_contact.contactEmail},
+                    ))
+        except Exception as e:
+            inc_pipeline_error(DOMAIN_HUBSPOT, "contact_upsert")
+            logger.warning(
+                "⚠️ Contact upsert failed",
+                extra=log_domain(DOMAIN_HUBSPOT, "contact_failed", memo_id=memo_id, error=str(e), company=extraction_for_contact.companyName, contact=extraction_for_contact.contactName),
+            )
+            pending_updates.append(self.crm_updates.build_update(
+                memo_id=memo_id,
+                user_id=user_id,
+                crm_connection_id=connection_id,
+                action_type="upsert_contact",
+                resource_type="contact",
+                data={"error": str(e)},
+            ))
+        return contact_id
+
+    async def _verify_scopes(
+        self,
+        connection_id: str,
+        pending_metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Raise HubSpotScopeError when the connection is known to lack a write scope
+        sync needs (metadata["missing_sync_scope"], recorded on connect).
+        
+        Connections without a recorded missing scope pass without any HubSpot call;
+        a missing scope is re-probed every SCOPE_RECHECK_SECONDS (result collected
+        in pending_metadata when given).
+        """
+        if not self.supabase:
+            return
+        try:
+            metadata = await _load_connection_metadata(self.supabase, connection_id)
+        except Exception:
+            return
+        missing_scope = metadata.get("missing_sync_scope")
+        if not missing_scope:
+            return
+        if time.time() - (metadata.get("scopes_checked_at") or 0) >= SCOPE_RECHECK_SECONDS:
+            missing_scope = await HubSpotValidationService(self.client).find_missing_sync_scope()
+            try:
+                _update_connection_metadata(
+                    self.supabase, connection_id,
+                    {"missing_sync_scope": missing_scope, "scopes_checked_at": int(time.time())},
+                    pending_metadata,
+                )
+            except Exception as e:
+                logger.warning("Failed to store scope check for connection %s: %s", connection_id, e)
+            if not missing_scope:
+                return
+        raise HubSpotScopeError(
+            "Connection is missing a HubSpot scope required to sync",
+            required_scope=missing_scope,
+        )
+
+    async def _resolve_portal(
+        self,
+        connection_id: str,
+        pending_metadata: Optional[dict[str, Any]] = None,
+    ) -> tuple[Optional[str], str]:
+        """
+        Resolve HubSpot portal ID and region for building the deal URL.
+        
+        Reads crm_connections.metadata first; falls back to /integrations/v1/me
+        (e.g. old connections without metadata) and backfills the metadata
+        (collected in pending_metadata when given).
+        Never raises: the deal URL is optional.
+        
+        Returns:
+            Tuple of (portal_id or None, region)
+        """
+        portal_id = None
+        region = "na1"
+        
+        # Try connection metadata first
+        if self.supabase:
+            try:
+                metadata = await _load_connection_metadata(self.supabase, connection_id)
+                portal_id = metadata.get("portal_id")
+                region = metadata.get("region", "na1")
+            except Exception as e:
+                logger.warning("Could not read connection metadata for %s: %s", connection_id, e)
+        
+        # Fallback: fetch portal_id from HubSpot API
+        if not portal_id:
+            try:
+                account_info = await self.client.get("/integrations/v1/me")
+                if account_info:
+                    portal_id = str(account_info.get("portalId", ""))
+                    # Update connection metadata for future syncs
+                    if portal_id and self.supabase:
+                        _update_connection_metadata(
+                            self.supabase, connection_id, {"portal_id": portal_id, "region": region},
+                            pending_metadata,
+                        )
+            except Exception:
+                pass
+        
+        return portal_id, region
+
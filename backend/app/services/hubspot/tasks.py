@@ -8,9 +8,10 @@ Uses /crm/v3/objects/tasks API.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from .client import HubSpotClient
@@ -31,60 +32,58 @@ SKIP_TASK_PATTERNS = [
     r"\bclose\s+the\s+deal\b",
     r"\bcerrar\s+contrato\b",
 ]
+# All skip patterns as one compiled regex: a single search per next step
+_SKIP_TASK_RE = re.compile("|".join(f"(?:{p})" for p in SKIP_TASK_PATTERNS), re.IGNORECASE)
 
 
 def _should_skip_next_step(text: str) -> bool:
     """Return True if this next step is too generic to create a task."""
-    if not text or len(text.strip()) < 5:
+    stripped = text.strip() if text else ""
+    if len(stripped) < 5:
         return True
-    lower = text.strip().lower()
-    for pattern in SKIP_TASK_PATTERNS:
-        if re.search(pattern, lower, re.IGNORECASE):
-            return True
-    return False
+    return _SKIP_TASK_RE.search(stripped.lower()) is not None
+
+
+# Spanish and English weekday names -> datetime.weekday()
+_WEEKDAYS = {
+    "lunes": 0, "martes": 1, "miércoles": 2, "miercoles": 2,
+    "jueves": 3, "viernes": 4, "sábado": 5, "sabado": 5, "domingo": 6,
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6,
+}
+_WEEKDAY_RE = re.compile(r"\b(" + "|".join(map(re.escape, _WEEKDAYS)) + r")\b")
+_NEXT_WEEK_RE = re.compile(r"pr[óo]xima\s+semana|next\s+week")
 
 
-def _parse_date_from_text(text: str) -> Optional[datetime]:
+def _parse_date_from_text(text: str, now: Optional[datetime] = None) -> Optional[datetime]:
     """
     Parse a date from Spanish/English phrases like:
     - "el martes", "el próximo martes"
     - "mañana"
     - "la próxima semana"
     - "next Tuesday"
+
+    Dates are relative to ``now`` (defaults to the current time, aware UTC).
     """
     if not text:
         return None
     lower = text.strip().lower()
-    now = datetime.utcnow()
-
-    # Spanish weekdays
-    dias = {
-        "lunes": 0, "martes": 1, "miércoles": 2, "miercoles": 2,
-        "jueves": 3, "viernes": 4, "sábado": 5, "sabado": 5, "domingo": 6,
-    }
-    # English
-    dias.update({
-        "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-        "friday": 4, "saturday": 5, "sunday": 6,
-    })
+    now = now or datetime.now(timezone.utc)
 
     # "mañana" / "tomorrow"
     if "mañana" in lower or "manana" in lower or "tomorrow" in lower:
         return now + timedelta(days=1)
 
-    # "el martes", "next tuesday", "el próximo martes"
-    for day_name, day_num in dias.items():
-        if day_name in lower:
-            # Find next occurrence of this weekday
-            days_ahead = (day_num - now.weekday()) % 7
-            if days_ahead == 0:
-                days_ahead = 7  # Next week
-            if "próxim" in lower or "proxim" in lower or "next" in lower or "siguiente" in lower:
-                pass  # Already getting next occurrence
-            return now + timedelta(days=days_ahead)
+    # "el martes", "next tuesday", "el próximo martes" - always the next occurrence
+    match = _WEEKDAY_RE.search(lower)
+    if match:
+        days_ahead = (_WEEKDAYS[match.group(1)] - now.weekday()) % 7
+        if days_ahead == 0:
+            days_ahead = 7  # Next week
+        return now + timedelta(days=days_ahead)
 
     # "la próxima semana" / "next week"
-    if "próxima semana" in lower or "proxima semana" in lower or "next week" in lower:
+    if _NEXT_WEEK_RE.search(lower):
         return now + timedelta(days=7)
 
     # Default: 3 days from now
@@ -99,15 +98,19 @@ class HubSpotTasksService:
     OBJECT_TYPE = "tasks"
     # Task-to-deal association type (HubSpot default: 216 = Task to deal)
     TASK_TO_DEAL_ASSOCIATION_TYPE = "216"
+    # HubSpot batch endpoints accept at most 100 inputs per request
+    BATCH_SIZE = 100
 
     def __init__(self, client: HubSpotClient):
         self.client = client
 
     def _to_timestamp_ms(self, dt: datetime) -> str:
-        """Convert datetime to HubSpot timestamp (milliseconds)."""
+        """Convert datetime to HubSpot timestamp (milliseconds). Naive datetimes are UTC."""
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
         return str(int(dt.timestamp() * 1000))
 
-    async def create_task(
+    def _build_task_input(
         self,
         subject: str,
         due_date: datetime,
@@ -116,21 +119,8 @@ class HubSpotTasksService:
         priority: str = "MEDIUM",
         task_type: str = "TODO",
         hubspot_owner_id: Optional[str] = None,
-    ) -> Optional[str]:
-        """
-        Create a task in HubSpot and optionally associate with a deal.
-
-        Args:
-            subject: Task title (hs_task_subject)
-            due_date: Due date for hs_timestamp
-            deal_id: Optional deal ID to associate
-            body: Optional task notes (hs_task_body)
-            priority: LOW, MEDIUM, HIGH
-            task_type: EMAIL, CALL, TODO
-
-        Returns:
-            Task ID if created, None on error
-        """
+    ) -> dict:
+        """Build a task create payload (properties + optional deal association)."""
         properties = {
             "hs_timestamp": self._to_timestamp_ms(due_date),
             "hs_task_subject": subject[:255] if subject else "Follow-up",
@@ -156,7 +146,62 @@ class HubSpotTasksService:
                     ],
                 }
             ]
+        return payload
+
+    def _build_update_properties(
+        self,
+        subject: Optional[str] = None,
+        due_date: Optional[datetime] = None,
+        hubspot_owner_id: Optional[str] = None,
+    ) -> dict:
+        """Build the properties for a task update (only the fields being changed)."""
+        properties = {}
+        if subject is not None:
+            properties["hs_task_subject"] = subject[:255] if subject else ""
+        if due_date is not None:
+            properties["hs_timestamp"] = self._to_timestamp_ms(due_date)
+        if hubspot_owner_id is not None:
+            properties["hubspot_owner_id"] = str(hubspot_owner_id)
+        return properties
+
+    async def create_task(
+        self,
+        subject: str,
+        due_date: datetime,
+        deal_id: Optional[str] = None,
+        body: Optional[str] = None,
+        priority: str = "MEDIUM",
+        task_type: str = "TODO",
+        hubspot_owner_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Create a task in HubSpot and optionally associate with a deal.
 
+        Args:
+            subject: Task title (hs_task_subject)
+            due_date: Due date for hs_timestamp
+            deal_id: Optional deal ID to associate
+            body: Optional task notes (hs_task_body)
+            priority: LOW, MEDIUM, HIGH
+            task_type: EMAIL, CALL, TODO
+
+        Returns:
+            Task ID if created, None on error
+        """
+        payload = self._build_task_input(
+            subject=subject,
+            due_date=due_date,
+            deal_id=deal_id,
+            body=body,
+            priority=priority,
+            task_type=task_type,
+            hubspot_owner_id=hubspot_owner_id,
+        )
+
+        return await self._post_task(payload)
+
+    async def _post_task(self, payload: dict) -> Optional[str]:
+        """Create one task from a built input; returns its ID, None on error."""
         try:
             response = await self.client.post(
                 f"/crm/v3/objects/{self.OBJECT_TYPE}",
@@ -168,6 +213,57 @@ class HubSpotTasksService:
         except HubSpotError:
             return None
 
+    async def create_tasks_batch(
+        self,
+        tasks: list[tuple[str, datetime]],
+        deal_id: Optional[str] = None,
+        body: Optional[str] = None,
+        hubspot_owner_id: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Create several tasks with one batch request per 100 tasks.
+
+        Uses POST /crm/v3/objects/tasks/batch/create with the deal association inline.
+
+        Args:
+            tasks: (subject, due_date) pairs
+            deal_id: Optional deal ID to associate every task with
+            body: Optional task notes shared by all tasks
+            hubspot_owner_id: Optional owner ID
+
+        Returns:
+            IDs of the created tasks. HubSpot rejects a whole batch for one invalid
+            input, so a failed batch is retried task by task.
+        """
+        inputs = [
+            self._build_task_input(
+                subject=subject,
+                due_date=due_date,
+                deal_id=deal_id,
+                body=body,
+                hubspot_owner_id=hubspot_owner_id,
+            )
+            for subject, due_date in tasks
+        ]
+        created: list[str] = []
+        for start in range(0, len(inputs), self.BATCH_SIZE):
+            try:
+                response = await self.client.post(
+                    f"/crm/v3/objects/{self.OBJECT_TYPE}/batch/create",
+                    data={"inputs": inputs[start:start + self.BATCH_SIZE]},
+                )
+            except HubSpotError as e:
+                logger.warning("Batch task create failed for deal %s, retrying one by one: %s", deal_id, e)
+                task_ids = await asyncio.gather(*(
+                    self._post_task(payload) for payload in inputs[start:start + self.BATCH_SIZE]
+                ))
+                created.extend(tid for tid in task_ids if tid)
+                continue
+            for r in (response or {}).get("results", []):
+                if r.get("id"):
+                    created.append(str(r["id"]))
+        return created
+
     async def create_tasks_from_extraction(
         self,
         extraction: MemoExtraction,
@@ -181,8 +277,10 @@ class HubSpotTasksService:
         Returns:
             List of created task IDs
         """
-        created: list[str] = []
+        tasks: list[tuple[str, datetime]] = []
         next_steps = extraction.nextSteps or []
+        now = datetime.now(timezone.utc)
+        default_due = now + timedelta(days=3)
 
         for step in next_steps:
             if not step or not isinstance(step, str):
@@ -190,19 +288,16 @@ class HubSpotTasksService:
             step = step.strip()
             if _should_skip_next_step(step):
                 continue
+            tasks.append((step[:255], _parse_date_from_text(step, now) or default_due))
 
-            due_date = _parse_date_from_text(step) or datetime.utcnow() + timedelta(days=3)
-            task_id = await self.create_task(
-                subject=step[:255],
-                due_date=due_date,
-                deal_id=deal_id,
-                body=extraction.summary or "",
-                hubspot_owner_id=hubspot_owner_id,
-            )
-            if task_id:
-                created.append(task_id)
-
-        return created
+        if not tasks:
+            return []
+        return await self.create_tasks_batch(
+            tasks,
+            deal_id=deal_id,
+            body=extraction.summary or "",
+            hubspot_owner_id=hubspot_owner_id,
+        )
 
     async def list_tasks_for_deal(
         self,
@@ -229,56 +324,62 @@ class HubSpotTasksService:
             if not resp or "results" not in resp:
                 return []
 
-            task_ids = []
+            # Ordered de-dup: toObjectId entries plus the objectId fallback
+            task_ids: dict[str, None] = {}
             for r in resp.get("results", []):
                 for to_item in r.get("to", []):
                     oid = to_item.get("toObjectId")
                     if oid is not None:
-                        task_ids.append(str(oid))
+                        task_ids[str(oid)] = None
                 # Fallback: objectId
                 oid = r.get("objectId") or r.get("id")
-                if oid is not None and str(oid) not in task_ids:
-                    task_ids.append(str(oid))
+                if oid is not None:
+                    task_ids[str(oid)] = None
 
             if not task_ids:
                 return []
 
-            # Batch read task details
-            batch_body = {
-                "inputs": [{"id": tid} for tid in task_ids],
-                "properties": props,
-            }
-            batch_resp = await self.client.post(
-                "/crm/v3/objects/tasks/batch/read",
-                data=batch_body,
-            )
-            if not batch_resp or "results" not in batch_resp:
-                return []
-
+            # Batch read task details (HubSpot caps batch inputs at BATCH_SIZE)
+            ids = list(task_ids)
             tasks = []
-            for t in batch_resp.get("results", []):
-                tid = t.get("id")
-                if not tid:
-                    continue
-                props_map = t.get("properties", {}) or {}
-                subject = props_map.get("hs_task_subject", "")
-                ts_ms = props_map.get("hs_timestamp")
-                due_date = None
-                if ts_ms:
-                    try:
-                        due_date = datetime.utcfromtimestamp(int(ts_ms) / 1000)
-                    except (ValueError, TypeError):
-                        pass
-                tasks.append({
-                    "id": str(tid),
-                    "subject": subject or "",
-                    "due_date": due_date,
-                })
+            for start in range(0, len(ids), self.BATCH_SIZE):
+                batch_resp = await self.client.post(
+                    "/crm/v3/objects/tasks/batch/read",
+                    data={
+                        "inputs": [{"id": tid} for tid in ids[start:start + self.BATCH_SIZE]],
+                        "properties": props,
+                    },
+                )
+                for t in (batch_resp or {}).get("results", []):
+                    task = self._parse_task(t)
+                    if task:
+                        tasks.append(task)
             return tasks
         except HubSpotError as e:
             logger.warning("Failed to list tasks for deal %s: %s", deal_id, e)
             return []
 
+    @staticmethod
+    def _parse_task(t: dict) -> Optional[dict]:
+        """Convert a task object from a batch read to {id, subject, due_date}."""
+        tid = t.get("id")
+        if not tid:
+            return None
+        props_map = t.get("properties", {}) or {}
+        subject = props_map.get("hs_task_subject", "")
+        ts_ms = props_map.get("hs_timestamp")
+        due_date = None
+        if ts_ms:
+            try:
+                due_date = datetime.fromtimestamp(int(ts_ms) / 1000, tz=timezone.utc)
+            except (ValueError, TypeError):
+                pass
+        return {
+            "id": str(tid),
+            "subject": subject or "",
+            "due_date": due_date,
+        }
+
     async def update_task(
         self,
         task_id: str,
@@ -298,15 +399,13 @@ class HubSpotTasksService:
         Returns:
             True if updated successfully
         """
-        properties = {}
-        if subject is not None:
-            properties["hs_task_subject"] = subject[:255] if subject else ""
-        if due_date is not None:
-            properties["hs_timestamp"] = self._to_timestamp_ms(due_date)
-        if hubspot_owner_id is not None:
-            properties["hubspot_owner_id"] = str(hubspot_owner_id)
+        properties = self._build_update_properties(subject, due_date, hubspot_owner_id)
         if not properties:
             return True
+        return await self._patch_task(task_id, properties)
+
+    async def _patch_task(self, task_id: str, properties: dict) -> bool:
+        """PATCH one task's properties; returns False on error."""
         try:
             await self.client.patch(
                 f"/crm/v3/objects/{self.OBJECT_TYPE}/{task_id}",
@@ -330,3 +429,73 @@ class HubSpotTasksService:
             return True
         except HubSpotError:
             return False
+
+    async def update_tasks_batch(
+        self,
+        updates: list[tuple[str, Optional[str], Optional[datetime]]],
+        hubspot_owner_id: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Update several tasks with one batch request per 100 tasks.
+
+        Uses POST /crm/v3/objects/tasks/batch/update; a failed batch is retried
+        task by task so one invalid input doesn't block the rest.
+
+        Args:
+            updates: (task_id, subject, due_date) triples; None fields are left unchanged
+            hubspot_owner_id: Optional owner ID applied to every task
+
+        Returns:
+            IDs of the tasks updated (or with nothing to change)
+        """
+        updated: list[str] = []
+        inputs = []
+        for task_id, subject, due_date in updates:
+            properties = self._build_update_properties(subject, due_date, hubspot_owner_id)
+            if properties:
+                inputs.append({"id": str(task_id), "properties": properties})
+            else:
+                updated.append(str(task_id))
+        for start in range(0, len(inputs), self.BATCH_SIZE):
+            chunk = inputs[start:start + self.BATCH_SIZE]
+            try:
+                await self.client.post(
+                    f"/crm/v3/objects/{self.OBJECT_TYPE}/batch/update",
+                    data={"inputs": chunk},
+                )
+            except HubSpotError as e:
+                logger.warning("Batch task update failed, retrying one by one: %s", e)
+                results = await asyncio.gather(*(
+                    self._patch_task(item["id"], item["properties"]) for item in chunk
+                ))
+                updated.extend(item["id"] for item, ok in zip(chunk, results) if ok)
+                continue
+            updated.extend(item["id"] for item in chunk)
+        return updated
+
+    async def delete_tasks_batch(self, task_ids: list[str]) -> list[str]:
+        """
+        Delete several tasks (moved to recycling bin) with one batch request per 100 tasks.
+
+        Uses POST /crm/v3/objects/tasks/batch/archive; a failed batch is retried
+        task by task.
+
+        Returns:
+            IDs of the tasks deleted
+        """
+        ids = [str(tid) for tid in task_ids]
+        deleted: list[str] = []
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            chunk = ids[start:start + self.BATCH_SIZE]
+            try:
+                await self.client.post(
+                    f"/crm/v3/objects/{self.OBJECT_TYPE}/batch/archive",
+                    data={"inputs": [{"id": tid} for tid in chunk]},
+                )
+            except HubSpotError as e:
+                logger.warning("Batch task delete failed, retrying one by one: %s", e)
+                results = await asyncio.gather(*(self.delete_task(tid) for tid in chunk))
+                deleted.extend(tid for tid, ok in zip(chunk, results) if ok)
+                continue
+            deleted.extend(chunk)
+        return deleted
@@ -192,6 +192,7 @@ class ValidationResult(BaseModel):
     portal_id: Optional[str] = None
     region: Optional[str] = "na1"  # eu1, na1, etc.
     scopes_ok: bool = False
+    missing_sync_scope: Optional[str] = None  # First write scope sync needs but lacks
     error: Optional[str] = None
     error_code: Optional[str] = None
 
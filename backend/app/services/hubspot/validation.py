@@ -5,7 +5,9 @@ Validates Private App tokens and checks required scopes.
 """
 
 from .client import HubSpotClient
-from .exceptions import HubSpotAuthError, HubSpotScopeError
+from typing import Optional
+
+from .exceptions import HubSpotAuthError, HubSpotError, HubSpotScopeError
 from .types import ValidationResult
 
 
@@ -35,6 +37,14 @@ class HubSpotValidationService:
         ],
     }
     
+    # Write scopes a memo sync can't work without, by object type (schema scopes
+    # are optional: enum normalization tolerates failed schema reads)
+    SYNC_REQUIRED_SCOPES = {
+        "deals": "crm.objects.deals.write",
+        "contacts": "crm.objects.contacts.write",
+        "companies": "crm.objects.companies.write",
+    }
+    
     def __init__(self, client: HubSpotClient):
         self.client = client
     
@@ -106,7 +116,8 @@ class HubSpotValidationService:
             )
         
         # Step 3: Test required scopes by making actual API calls
-        scopes_ok = await self._test_scopes()
+        scopes_ok = await self.check_scopes()
+        missing_sync_scope = await self.find_missing_sync_scope()
         
         # Determine region from token if possible
         region = "na1"
@@ -122,9 +133,10 @@ class HubSpotValidationService:
             portal_id=portal_id,
             region=region,
             scopes_ok=scopes_ok,
+            missing_sync_scope=missing_sync_scope,
         )
     
-    async def _test_scopes(self) -> bool:
+    async def check_scopes(self) -> bool:
         """
         Test if required scopes are available by making test API calls.
         
@@ -150,4 +162,25 @@ class HubSpotValidationService:
         except Exception:
             # Other errors (like network issues) don't mean scopes are missing
             return True  # Assume scopes are OK, let actual operations fail if needed
-
+    
+    async def find_missing_sync_scope(self) -> Optional[str]:
+        """
+        Find the first write scope in SYNC_REQUIRED_SCOPES the token lacks.
+        
+        Sends an empty batch update per object type: HubSpot checks the scope
+        before the payload, so a 403 means the scope is missing and anything
+        else (typically a 400 for the empty input) means it is granted.
+        Nothing is written.
+        
+        Returns:
+            The missing scope, or None when all are available (or unknown)
+        """
+        for object_type, scope in self.SYNC_REQUIRED_SCOPES.items():
+            try:
+                await self.client.post(f"/crm/v3/objects/{object_type}/batch/update", data={"inputs": []})
+            except HubSpotScopeError:
+                return scope
+            except HubSpotError:
+                # Validation errors etc. come after the scope check: scope granted
+                continue
+        return None
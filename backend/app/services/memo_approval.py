@@ -139,7 +139,7 @@ async def approve_memo_core(
         auto_create_companies = False
         auto_create_contacts = False
 
-    client = HubSpotClient(crm_connection["access_token"])
+    client = HubSpotClient(crm_connection["access_token"], rate_limit_key=crm_connection["id"])
     schema_service = HubSpotSchemaService(client, supabase, crm_connection["id"])
     search_service = HubSpotSearchService(client)
     deal_service = HubSpotDealService(client, search_service, schema_service)
@@ -182,6 +182,7 @@ async def approve_memo_core(
         auto_create_contact_company=auto_create_contact_company,
         auto_create_companies=auto_create_companies,
         auto_create_contacts=auto_create_contacts,
+        connection_metadata=crm_connection.get("metadata") or {},
     )
 
     if not sync_result.success:
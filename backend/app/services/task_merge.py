@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 from app.models.memo import MemoExtraction
@@ -52,14 +52,14 @@ def _format_task_for_prompt(t: dict) -> str:
 
 
 def _parse_date_from_llm(value: Optional[str]) -> Optional[datetime]:
-    """Parse YYYY-MM-DD from LLM output."""
+    """Parse YYYY-MM-DD from LLM output (midnight UTC, timezone-aware)."""
     if not value or not isinstance(value, str):
         return None
     s = value.strip()[:10]
     if len(s) < 10:
         return None
     try:
-        return datetime.strptime(s, "%Y-%m-%d")
+        return datetime.strptime(s, "%Y-%m-%d").replace(tzinfo=timezone.utc)
     except ValueError:
         return None
 
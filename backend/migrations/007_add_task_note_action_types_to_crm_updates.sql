@@ -0,0 +1,20 @@
+-- Migration: Add task and note action types to crm_updates action_type check
+-- Purpose: The sync service records merge_tasks, create_tasks and create_note rows;
+--          the constraint from 003 only allowed deal/company/contact actions
+--
+-- Run this in your Supabase SQL Editor
+
+ALTER TABLE crm_updates
+DROP CONSTRAINT IF EXISTS crm_updates_action_type_check;
+
+ALTER TABLE crm_updates
+ADD CONSTRAINT crm_updates_action_type_check
+CHECK (action_type IN (
+  'create_deal',
+  'update_deal',
+  'upsert_company',
+  'upsert_contact',
+  'create_tasks',
+  'merge_tasks',
+  'create_note'
+));
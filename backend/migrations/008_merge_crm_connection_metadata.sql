@@ -0,0 +1,14 @@
+-- Migration: Atomic merge into crm_connections.metadata
+-- Purpose: The sync service caches portal/owner/scope info in metadata. Merging
+--          server-side (metadata || patch) avoids the read-modify-write race where
+--          concurrent syncs overwrite each other's keys, and only sends the changed keys.
+--
+-- Run this in your Supabase SQL Editor
+
+CREATE OR REPLACE FUNCTION merge_crm_connection_metadata(conn_id UUID, patch JSONB)
+RETURNS JSONB AS $$
+  UPDATE crm_connections
+  SET metadata = COALESCE(metadata, '{}'::jsonb) || patch
+  WHERE id = conn_id
+  RETURNING metadata;
+$$ LANGUAGE sql;
@@ -0,0 +1,10 @@
+-- Migration: Index successful crm_updates rows by memo and action type
+-- Purpose: On retry, the sync service looks up a memo's latest successful
+--          upsert_company / upsert_contact rows to reuse their IDs. A partial index
+--          on the success rows serves that query without scanning the memo's history.
+--
+-- Run this in your Supabase SQL Editor
+
+CREATE INDEX IF NOT EXISTS idx_crm_updates_memo_action_success
+ON crm_updates(memo_id, action_type, created_at DESC)
+WHERE status = 'success';
@@ -20,6 +20,7 @@ DROP TRIGGER IF EXISTS user_profiles_updated_at ON user_profiles;
 
 -- Drop functions
 DROP FUNCTION IF EXISTS update_updated_at();
+DROP FUNCTION IF EXISTS merge_crm_connection_metadata(UUID, JSONB);
 
 -- Drop policies
 DROP POLICY IF EXISTS "Users can manage own memos" ON memos;
@@ -155,6 +156,15 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Merge keys into crm_connections.metadata atomically (used by the sync service)
+CREATE OR REPLACE FUNCTION merge_crm_connection_metadata(conn_id UUID, patch JSONB)
+RETURNS JSONB AS $$
+  UPDATE crm_connections
+  SET metadata = COALESCE(metadata, '{}'::jsonb) || patch
+  WHERE id = conn_id
+  RETURNING metadata;
+$$ LANGUAGE sql;
+
 -- Apply triggers
 CREATE TRIGGER user_profiles_updated_at
   BEFORE UPDATE ON user_profiles